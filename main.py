@@ -38,11 +38,7 @@ from src.api.routers.v2.lessons import router as lesson_v2_router
 
 from src.core.app_context import app_context
 from src.core.logging_config import setup_structured_logging
-from src.core.middleware import (
-    RequestIDMiddleware,
-    StructuredLoggingMiddleware,
-    ExceptionLoggingMiddleware,
-)
+from src.core.middleware import ObservabilityMiddleware
 from src.core.metrics import MetricsMiddleware, metrics_endpoint
 
 logger = logging.getLogger(__name__)
@@ -84,9 +80,7 @@ app.add_middleware(
 
 # Middlewares (order matters - first added = outermost)
 app.add_middleware(MetricsMiddleware)
-app.add_middleware(ExceptionLoggingMiddleware)
-app.add_middleware(StructuredLoggingMiddleware)
-app.add_middleware(RequestIDMiddleware)
+app.add_middleware(ObservabilityMiddleware)
 
 # Create directories
 static_audio_dir = BASE_DIR / "static" / "audio"
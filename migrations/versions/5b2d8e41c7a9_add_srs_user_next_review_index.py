@@ -0,0 +1,34 @@
+"""Add composite (user_id, next_review) index to SRSMemory
+
+Revision ID: 5b2d8e41c7a9
+Revises: 9e7f1cf751cb
+Create Date: 2026-10-16 09:12:41.503118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5b2d8e41c7a9"
+down_revision: Union[str, Sequence[str], None] = "9e7f1cf751cb"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Serves the paged due-review query (filter user, order by next_review)
+    op.create_index(
+        "idx_srs_user_next_review",
+        "SRSMemory",
+        ["user_id", "next_review"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_srs_user_next_review", table_name="SRSMemory")
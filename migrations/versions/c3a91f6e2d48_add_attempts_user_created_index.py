@@ -0,0 +1,34 @@
+"""Add composite (user_id, created_at) index to Attempts
+
+Revision ID: c3a91f6e2d48
+Revises: 5b2d8e41c7a9
+Create Date: 2026-10-16 10:41:07.118542
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3a91f6e2d48"
+down_revision: Union[str, Sequence[str], None] = "5b2d8e41c7a9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Serves per-user attempt aggregates and the latest-attempts trend query
+    op.create_index(
+        "idx_attempts_user_created",
+        "Attempts",
+        ["user_id", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_attempts_user_created", table_name="Attempts")
@@ -47,7 +47,7 @@ class UserResponse(BaseModel):
 
 
 @router.post("/login", response_model=dict)
-async def login(
+def login(
     form_data: OAuth2PasswordRequestForm = Depends(), db_service: Database = Depends()
 ):
     """Authenticate user and return JWT tokens."""
@@ -78,7 +78,7 @@ async def login(
 
 
 @router.post("/refresh", response_model=dict)
-async def refresh_token(request: RefreshTokenRequest, db_service: Database = Depends()):
+def refresh_token(request: RefreshTokenRequest, db_service: Database = Depends()):
     """Refresh access token using refresh token."""
     try:
         # Verify the refresh token
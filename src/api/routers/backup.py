@@ -15,7 +15,7 @@ router = APIRouter(prefix="/api/backup", tags=["backup"])
 
 
 @router.get("/export", response_model=BackupExportResponse, status_code=200)
-async def backup_export(
+def backup_export(
     user_id: int = Query(..., description="User ID", gt=0),
     format: str = Query(
         "json",
@@ -5,6 +5,7 @@ from fastapi import APIRouter, HTTPException
 
 from src.api.schemas import ChatRespondRequest, ChatRespondResponse
 from src.core.app_context import app_context
+from src.services.user_stats_cache import invalidate_user_stats_cache
 
 logger = logging.getLogger(__name__)
 
@@ -12,7 +13,7 @@ router = APIRouter(prefix="/api/chat", tags=["chat"])
 
 
 @router.post("/respond", response_model=ChatRespondResponse, status_code=200)
-async def chat_respond(request: ChatRespondRequest):
+def chat_respond(request: ChatRespondRequest):
     """Process user message and return tutor response.
 
     Args:
@@ -41,6 +42,8 @@ async def chat_respond(request: ChatRespondRequest):
                 status_code=400, detail=response.get("message", "Invalid request")
             )
 
+        # A new attempt was recorded, so cached stats are stale
+        invalidate_user_stats_cache(request.user_id)
         return response
 
     except HTTPException:
@@ -1,6 +1,8 @@
 """Error reporting API endpoints."""
 
 import logging
+from datetime import datetime
+
 from fastapi import APIRouter, HTTPException
 
 from src.api.schemas import ErrorReportRequest, ErrorReportResponse
@@ -35,8 +37,6 @@ async def error_report(request: ErrorReportRequest):
         if request.context:
             logger.debug(f"Error context: {request.context}")
 
-        from datetime import datetime
-
         return {
             "status": "success",
             "message": "Error report logged successfully",
@@ -34,7 +34,7 @@ class LessonGenerateResponse(BaseModel):
 
 
 @router.get("/get", response_model=LessonGetResponse, status_code=200)
-async def lesson_get(lesson_id: str = Query(..., description="Lesson ID")):
+def lesson_get(lesson_id: str = Query(..., description="Lesson ID")):
     """Fetch lesson dialogues and metadata.
 
     Args:
@@ -66,7 +66,7 @@ async def lesson_get(lesson_id: str = Query(..., description="Lesson ID")):
 
 
 @router.get("/options", response_model=LessonOptionsResponse, status_code=200)
-async def lesson_options(
+def lesson_options(
     lesson_id: str = Query(..., description="Lesson ID"),
     dialogue_id: str = Query(..., description="Dialogue ID"),
 ):
@@ -135,7 +135,7 @@ async def lesson_catalog():
 
 
 @router.post("/generate", response_model=LessonGenerateResponse, status_code=200)
-async def lesson_generate(request: LessonGenerateRequest):
+def lesson_generate(request: LessonGenerateRequest):
     """Generate a custom lesson on-demand using AI.
 
     Args:
@@ -20,22 +20,36 @@ router = APIRouter(prefix="/api/review", tags=["review"])
 
 @router.get("/get", response_model=ReviewGetResponse, status_code=200)
 @router.get("/due", response_model=ReviewGetResponse, status_code=200)
-async def review_get_due(user_id: int = Query(..., description="User ID", gt=0)):
-    """Return due review items for the user."""
+def review_get_due(
+    user_id: int = Query(..., description="User ID", gt=0),
+    limit: int = Query(50, description="Maximum items to return", ge=1, le=200),
+    offset: int = Query(0, description="Number of due items to skip", ge=0),
+):
+    """Return a page of due review items for the user, oldest first."""
     try:
         tutor = app_context.tutor
         database = app_context.database
 
-        # Try SRS manager first, fall back to direct database query in tests/offline mode
+        # Prefer the database query, which joins phrase details in one round
+        # trip; fall back to the SRS manager when the database lacks it
+        # due_count is the total number of due items, not the page size
         due_memories: Iterable[Any] = []
+        due_count: Optional[int] = None
         srs_manager = getattr(tutor, "srs_manager", None)
-        if srs_manager and hasattr(srs_manager, "get_due_items"):
+        if hasattr(database, "get_due_srs_items"):
+            due_memories = database.get_due_srs_items(
+                user_id, limit=limit, offset=offset
+            )
+            if hasattr(database, "count_due_srs_items"):
+                due_count = database.count_due_srs_items(user_id)
+        elif srs_manager and hasattr(srs_manager, "get_due_items"):
             try:
                 due_memories = srs_manager.get_due_items(user_id, database=database)
             except TypeError:
                 due_memories = srs_manager.get_due_items(user_id)
-        elif hasattr(database, "get_due_srs_items"):
-            due_memories = database.get_due_srs_items(user_id)
+            all_due = list(due_memories)
+            due_count = len(all_due)
+            due_memories = all_due[offset : offset + limit]
         else:
             due_memories = []
 
@@ -45,7 +59,10 @@ async def review_get_due(user_id: int = Query(..., description="User ID", gt=0))
                 "message": "No due items found.",
                 "data": [],
                 "metadata": {
-                    "due_count": 0,
+                    "due_count": due_count or 0,
+                    "page_count": 0,
+                    "limit": limit,
+                    "offset": offset,
                     "timestamp": datetime.utcnow().isoformat() + "Z",
                 },
             }
@@ -53,6 +70,9 @@ async def review_get_due(user_id: int = Query(..., description="User ID", gt=0))
         # Format response with phrase details from lesson files
         # Extract attributes from ORM objects while session is accessible
         review_list: List[Dict[str, Any]] = []
+        # Dialogues by id for each lesson touched by this page, so every
+        # lesson is fetched and scanned once
+        dialogue_indexes: Dict[str, Dict[str, Dict[str, Any]]] = {}
         for memory in due_memories:
             # Extract all attributes before session closes
             phrase_id = _get_attr(memory, "phrase_id")
@@ -72,15 +92,20 @@ async def review_get_due(user_id: int = Query(..., description="User ID", gt=0))
             translation = None
             audio = None
 
-            # Try to get phrase from database first
-            phrase = (
-                database.get_phrase(phrase_id)
-                if hasattr(database, "get_phrase")
-                else None
-            )
-            if phrase:
-                lesson_id = getattr(phrase, "lesson_id", None)
-                phrase_text = getattr(phrase, "text", None)
+            # Use phrase details joined into the due query, otherwise look
+            # the phrase up in the database
+            if isinstance(memory, dict) and "lesson_id" in memory:
+                lesson_id = memory.get("lesson_id")
+                phrase_text = memory.get("phrase_text")
+            else:
+                phrase = (
+                    database.get_phrase(phrase_id)
+                    if hasattr(database, "get_phrase")
+                    else None
+                )
+                if phrase:
+                    lesson_id = getattr(phrase, "lesson_id", None)
+                    phrase_text = getattr(phrase, "text", None)
 
             # If lesson_id not found from database, extract from phrase_id (format: L1_turn1)
             if not lesson_id:
@@ -90,21 +115,24 @@ async def review_get_due(user_id: int = Query(..., description="User ID", gt=0))
 
             # Get phrase details from lesson file if lesson_id is known
             if lesson_id:
-                lesson_data = tutor.lesson_manager.get_lesson(lesson_id)
-                if lesson_data and "dialogues" in lesson_data:
-                    # Find the dialogue matching this phrase_id
-                    for dialogue in lesson_data["dialogues"]:
-                        if dialogue.get("id") == phrase_id:
-                            # Prefer tutor line but fall back to expected responses
-                            lesson_phrase_text = dialogue.get("tutor") or (
-                                dialogue.get("expected", [None])[0]
-                                if dialogue.get("expected")
-                                else None
-                            )
-                            phrase_text = lesson_phrase_text or phrase_text
-                            translation = dialogue.get("translation") or translation
-                            audio = dialogue.get("audio") or audio
-                            break
+                dialogues = dialogue_indexes.get(lesson_id)
+                if dialogues is None:
+                    dialogues = _index_lesson_dialogues(
+                        tutor.lesson_manager.get_lesson(lesson_id)
+                    )
+                    dialogue_indexes[lesson_id] = dialogues
+
+                dialogue = dialogues.get(phrase_id)
+                if dialogue is not None:
+                    # Prefer tutor line but fall back to expected responses
+                    lesson_phrase_text = dialogue.get("tutor") or (
+                        dialogue.get("expected", [None])[0]
+                        if dialogue.get("expected")
+                        else None
+                    )
+                    phrase_text = lesson_phrase_text or phrase_text
+                    translation = dialogue.get("translation") or translation
+                    audio = dialogue.get("audio") or audio
 
             # Build review item dict
             review_item = {
@@ -130,11 +158,14 @@ async def review_get_due(user_id: int = Query(..., description="User ID", gt=0))
             review_list.append(review_item)
 
         metadata = {
-            "due_count": len(review_list),
+            "due_count": len(review_list) if due_count is None else due_count,
+            "page_count": len(review_list),
+            "limit": limit,
+            "offset": offset,
             "timestamp": datetime.utcnow().isoformat() + "Z",
         }
 
-        logger.info(f"🧠 Found {len(review_list)} due SRS items for user {user_id}")
+        logger.info("🧠 Found %d due SRS items for user %s", len(review_list), user_id)
 
         return {
             "status": "success",
@@ -151,7 +182,7 @@ async def review_get_due(user_id: int = Query(..., description="User ID", gt=0))
 
 
 @router.post("/update", response_model=ReviewUpdateResponse, status_code=200)
-async def review_update(request: ReviewUpdateRequest = Body(...)):
+def review_update(request: ReviewUpdateRequest = Body(...)):
     """Update SRS memory after review submission."""
     try:
         tutor = app_context.tutor
@@ -206,6 +237,19 @@ async def review_update(request: ReviewUpdateRequest = Body(...)):
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+def _index_lesson_dialogues(
+    lesson_data: Optional[Dict[str, Any]],
+) -> Dict[str, Dict[str, Any]]:
+    """Map dialogue IDs to dialogues for a lesson (empty if unavailable)."""
+    if not lesson_data or "dialogues" not in lesson_data:
+        return {}
+    index: Dict[str, Dict[str, Any]] = {}
+    for dialogue in lesson_data["dialogues"]:
+        # Keep the first dialogue for duplicated IDs, as the linear scan did
+        index.setdefault(dialogue.get("id"), dialogue)
+    return index
+
+
 def _get_attr(obj: Any, key: str, default: Optional[Any] = None) -> Any:
     """Retrieve key/attribute from multiple storage types."""
     if obj is None:
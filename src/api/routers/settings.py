@@ -18,7 +18,7 @@ router = APIRouter(prefix="/api/settings", tags=["settings"])
 
 
 @router.get("/get", response_model=SettingsGetResponse, status_code=200)
-async def settings_get(user_id: int = Query(..., description="User ID", gt=0)):
+def settings_get(user_id: int = Query(..., description="User ID", gt=0)):
     """Load preferences for user profile."""
     try:
         database = app_context.database
@@ -96,7 +96,7 @@ async def settings_get(user_id: int = Query(..., description="User ID", gt=0)):
 
 
 @router.post("/update", response_model=SettingsUpdateResponse, status_code=200)
-async def settings_update(request: SettingsUpdateRequest):
+def settings_update(request: SettingsUpdateRequest):
     """Save preferences snapshot."""
     try:
         database = app_context.database
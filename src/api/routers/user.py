@@ -2,11 +2,14 @@
 
 import logging
 from datetime import datetime, timedelta
+from typing import Any, Dict
+
 from fastapi import APIRouter, HTTPException, Query
 
 from src.api.schemas import UserStatsResponse
 from src.core.app_context import app_context
 from src.models import Attempt, LessonProgress
+from src.services.user_stats_cache import user_stats_cache
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +17,7 @@ router = APIRouter(prefix="/api/user", tags=["user"])
 
 
 @router.get("/stats", response_model=UserStatsResponse, status_code=200)
-async def user_stats(user_id: int = Query(..., description="User ID", gt=0)):
+def user_stats(user_id: int = Query(..., description="User ID", gt=0)):
     """Return progress %, study time, accuracy trends.
 
     Args:
@@ -23,82 +26,83 @@ async def user_stats(user_id: int = Query(..., description="User ID", gt=0)):
     Returns:
         User statistics including progress, study time, accuracy
     """
+    cached = user_stats_cache.get(user_id)
+    if cached is not None:
+        return cached
+
+    generation = user_stats_cache.generation(user_id)
     try:
-        database = app_context.database
-
-        # Get all attempts for user
-        attempts = database.get_user_attempts(user_id)
-
-        # Calculate statistics
-        total_attempts = len(attempts)
-
-        if total_attempts == 0:
-            return {
-                "status": "success",
-                "message": "No statistics available",
-                "data": {
-                    "user_id": user_id,
-                    "total_attempts": 0,
-                    "progress_percent": 0.0,
-                    "study_time_minutes": 0,
-                    "average_accuracy": 0.0,
-                    "accuracy_trend": [],
-                },
-            }
-
-        # Extract scores immediately while session is active
-        attempt_scores = [
-            attempt.score for attempt in attempts if attempt.score is not None
-        ]
-        total_score = sum(attempt_scores)
-        average_accuracy = (
-            (total_score / total_attempts) * 100 if total_attempts > 0 else 0.0
-        )
-
-        # Calculate study time (estimate: 1 minute per 5 attempts)
-        study_time_minutes = total_attempts / 5
-
-        # Get lesson progress
-        lesson_progress = database.get_user_progresses(user_id)
-        completed_lessons = len(
-            [lp for lp in lesson_progress if lp.status == "completed"]
-        )
-        total_lessons = len(lesson_progress) if lesson_progress else 1
-        progress_percent = (
-            (completed_lessons / total_lessons * 100) if total_lessons > 0 else 0.0
-        )
-
-        # Calculate accuracy trend (last 10 attempts)
-        recent_attempts = sorted(
-            attempts,
-            key=lambda x: x.created_at if x.created_at else datetime.min,
-            reverse=True,
-        )[:10]
-        accuracy_trend = [
-            {
-                "date": (
-                    attempt.created_at.isoformat() + "Z"
-                    if attempt.created_at
-                    else datetime.utcnow().isoformat() + "Z"
-                ),
-                "accuracy": attempt.score * 100 if attempt.score else 0.0,
-            }
-            for attempt in reversed(recent_attempts)
-        ]
+        result = _build_user_stats(user_id)
+    except Exception as e:
+        logger.error(f"Error in user_stats: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+    user_stats_cache.store(user_id, generation, result)
+    return result
+
 
+def _build_user_stats(user_id: int) -> Dict[str, Any]:
+    """Compute the /stats response payload for a user."""
+    database = app_context.database
+
+    # Count and score totals are aggregated by the database
+    total_attempts, total_score = database.get_user_attempt_summary(user_id)
+
+    if total_attempts == 0:
         return {
             "status": "success",
-            "message": "Statistics retrieved successfully",
+            "message": "No statistics available",
             "data": {
                 "user_id": user_id,
-                "total_attempts": total_attempts,
-                "progress_percent": round(progress_percent, 2),
-                "study_time_minutes": round(study_time_minutes, 1),
-                "average_accuracy": round(average_accuracy, 2),
-                "accuracy_trend": accuracy_trend,
+                "total_attempts": 0,
+                "progress_percent": 0.0,
+                "study_time_minutes": 0,
+                "average_accuracy": 0.0,
+                "accuracy_trend": [],
             },
         }
 
-    except Exception as e:
-        logger.error(f"Error in user_stats: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    average_accuracy = (
+        (total_score / total_attempts) * 100 if total_attempts > 0 else 0.0
+    )
+
+    # Calculate study time (estimate: 1 minute per 5 attempts)
+    study_time_minutes = total_attempts / 5
+
+    # Get lesson progress (completed/total counted by the database)
+    completed_lessons, total_lessons = database.get_user_progress_counts(user_id)
+    total_lessons = total_lessons or 1
+    progress_percent = (
+        (completed_lessons / total_lessons * 100) if total_lessons > 0 else 0.0
+    )
+
+    # Calculate accuracy trend (last 10 attempts)
+    recent_attempts = sorted(
+        database.get_user_attempts(user_id, limit=10),
+        key=lambda x: x.created_at if x.created_at else datetime.min,
+        reverse=True,
+    )[:10]
+    accuracy_trend = [
+        {
+            "date": (
+                attempt.created_at.isoformat() + "Z"
+                if attempt.created_at
+                else datetime.utcnow().isoformat() + "Z"
+            ),
+            "accuracy": attempt.score * 100 if attempt.score else 0.0,
+        }
+        for attempt in reversed(recent_attempts)
+    ]
+
+    return {
+        "status": "success",
+        "message": "Statistics retrieved successfully",
+        "data": {
+            "user_id": user_id,
+            "total_attempts": total_attempts,
+            "progress_percent": round(progress_percent, 2),
+            "study_time_minutes": round(study_time_minutes, 1),
+            "average_accuracy": round(average_accuracy, 2),
+            "accuracy_trend": accuracy_trend,
+        },
+    }
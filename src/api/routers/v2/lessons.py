@@ -1,15 +1,21 @@
 """Lesson navigation endpoints for Phase B."""
 
 from pathlib import Path
+import asyncio
 import logging
+import os
 import shutil
 from typing import cast
 
 from fastapi import APIRouter, HTTPException, Query
 
-from src.schemas.v2.lessons import LessonMetaResponse, LessonNextResponse
+from src.core.app_context import AUDIO_CACHE_V2_DIR, app_context
+from src.schemas.v2.lessons import (
+    LessonMetaResponse,
+    LessonNextResponse,
+    LessonPhraseMeta,
+)
 from src.services.lesson_flow import LessonFlowService
-from src.services.speech_engine import SpeechEngine
 
 logger = logging.getLogger(__name__)
 
@@ -18,10 +24,16 @@ router = APIRouter(prefix="/api/v2/lesson", tags=["lesson-v2"])
 
 _lesson_flow_service = LessonFlowService()
 
-PROJECT_ROOT = Path(__file__).resolve().parents[4]
-AUDIO_CACHE_V2_DIR = PROJECT_ROOT / "static" / "audio_cache_v2"
-AUDIO_CACHE_V2_DIR.mkdir(parents=True, exist_ok=True)
-_speech_engine = SpeechEngine(cache_dir=str(AUDIO_CACHE_V2_DIR))
+
+def _link_or_copy(source_path: Path, target_path: Path) -> None:
+    """Hardlink cached audio into place, copying across filesystems."""
+    try:
+        os.link(source_path, target_path)
+    except FileExistsError:
+        pass
+    except OSError:
+        # EXDEV or no hardlink support; copyfile still uses sendfile on Linux
+        shutil.copyfile(source_path, target_path)
 
 
 def _ensure_phrase_audio(lesson_id: str, phrase_id: str, text: str) -> str:
@@ -32,7 +44,7 @@ def _ensure_phrase_audio(lesson_id: str, phrase_id: str, text: str) -> str:
 
     source_path_str = None
     try:
-        source_path_str, _ = _speech_engine.get_audio_path(
+        source_path_str, _ = app_context.speech_engine.get_audio_path(
             text=text, lesson_id=lesson_id, phrase_id=phrase_id
         )
     except Exception as exc:  # pragma: no cover - log + fallback
@@ -48,7 +60,7 @@ def _ensure_phrase_audio(lesson_id: str, phrase_id: str, text: str) -> str:
                     target_path.parent.mkdir(parents=True, exist_ok=True)
                 else:
                     target_path.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copyfile(source_path, target_path)
+                    _link_or_copy(source_path, target_path)
         except OSError as exc:  # pragma: no cover
             logger.error("Unable to copy synthesized audio for %s: %s", phrase_id, exc)
 
@@ -59,7 +71,10 @@ def _ensure_phrase_audio(lesson_id: str, phrase_id: str, text: str) -> str:
     return f"/audio_cache_v2/{target_path.name}"
 
 
-@router.get("/{lesson_id}", response_model=LessonMetaResponse)
+# Responses are assembled from server-side lesson data with known types, so
+# they are built with model_construct and response_model=None skips
+# FastAPI's second validation pass; the annotations document the shape.
+@router.get("/{lesson_id}", response_model=None)
 async def get_lesson_manifest(lesson_id: str) -> LessonMetaResponse:
     """Return lesson manifest (ids + translations)."""
     try:
@@ -67,20 +82,20 @@ async def get_lesson_manifest(lesson_id: str) -> LessonMetaResponse:
     except KeyError:
         raise HTTPException(status_code=404, detail="Unknown lesson_id") from None
 
-    return LessonMetaResponse(
+    return LessonMetaResponse.model_construct(
         lesson_id=lesson_id,
         phrases=[
-            {
-                "id": phrase["id"],
-                "pl": phrase["pl"],
-                "en": phrase.get("en", ""),
-            }
+            LessonPhraseMeta.model_construct(
+                id=phrase["id"],
+                pl=phrase["pl"],
+                en=phrase.get("en", ""),
+            )
             for phrase in phrases
         ],
     )
 
 
-@router.get("/{lesson_id}/next", response_model=LessonNextResponse)
+@router.get("/{lesson_id}/next", response_model=None)
 async def get_next_phrase(
     lesson_id: str, index: int = Query(0, ge=0)
 ) -> LessonNextResponse:
@@ -101,8 +116,12 @@ async def get_next_phrase(
         filename = Path(cast(str, audio_url)).name
         result["audio_url"] = f"/audio_cache_v2/{filename}"
     else:
-        result["audio_url"] = _ensure_phrase_audio(
-            lesson_id, phrase_id, cast(str, result["tutor_phrase"])
+        # Synthesis and copying block on network/disk; keep the loop free
+        result["audio_url"] = await asyncio.to_thread(
+            _ensure_phrase_audio,
+            lesson_id,
+            phrase_id,
+            cast(str, result["tutor_phrase"]),
         )
 
-    return LessonNextResponse(**result)
+    return LessonNextResponse.model_construct(**result)
@@ -8,9 +8,13 @@ from typing import Dict, Optional
 from fastapi import WebSocket, WebSocketDisconnect
 
 from src.core.app_context import app_context
+from src.services.user_stats_cache import invalidate_user_stats_cache
 
 logger = logging.getLogger(__name__)
 
+# Upper bound for a single client frame; chat turns are a few hundred bytes
+MAX_MESSAGE_LENGTH = 16 * 1024
+
 
 class ConnectionManager:
     """Manages WebSocket connections."""
@@ -28,13 +32,15 @@ class ConnectionManager:
             user_id: User ID
         """
         # For Phase 1: single user per connection, disconnect existing if any
-        if user_id in self.active_connections:
+        previous = self.active_connections.pop(user_id, None)
+        if previous is not None:
             try:
-                await self.active_connections[user_id].close()
-            except Exception:
+                await previous.close()
+            except (WebSocketDisconnect, RuntimeError):
+                # Previous socket already closed
                 pass
         self.active_connections[user_id] = websocket
-        logger.info(f"WebSocket connected for user {user_id}")
+        logger.info("WebSocket connected for user %s", user_id)
 
     def disconnect(self, user_id: int):
         """Remove a WebSocket connection.
@@ -42,9 +48,8 @@ class ConnectionManager:
         Args:
             user_id: User ID
         """
-        if user_id in self.active_connections:
-            del self.active_connections[user_id]
-            logger.info(f"WebSocket disconnected for user {user_id}")
+        if self.active_connections.pop(user_id, None) is not None:
+            logger.info("WebSocket disconnected for user %s", user_id)
 
     async def send_personal_message(self, message: dict, user_id: int):
         """Send a message to a specific user.
@@ -53,13 +58,38 @@ class ConnectionManager:
             message: Message dictionary to send
             user_id: User ID
         """
-        if user_id in self.active_connections:
+        websocket = self.active_connections.get(user_id)
+        if websocket is not None:
             try:
-                await self.active_connections[user_id].send_json(message)
+                await websocket.send_json(message)
             except Exception as e:
-                logger.error(f"Error sending message to user {user_id}: {e}")
+                logger.error("Error sending message to user %s: %s", user_id, e)
                 self.disconnect(user_id)
 
+    async def broadcast(self, message: dict, batch: int = 50):
+        """Send a message to every connected user.
+
+        The payload is encoded once and sent in batches so that a large
+        number of clients does not stall the event loop.
+
+        Args:
+            message: Message dictionary to send
+            batch: Maximum number of concurrent sends per batch
+        """
+        payload = json.dumps(message)
+        connections = list(self.active_connections.items())
+        for start in range(0, len(connections), batch):
+            chunk = connections[start : start + batch]
+            results = await asyncio.gather(
+                *(websocket.send_text(payload) for _, websocket in chunk),
+                return_exceptions=True,
+            )
+            for (user_id, _), result in zip(chunk, results):
+                if isinstance(result, Exception):
+                    logger.error("Error broadcasting to user %s: %s", user_id, result)
+                    self.disconnect(user_id)
+            await asyncio.sleep(0)
+
 
 # Global connection manager instance
 manager = ConnectionManager()
@@ -97,7 +127,7 @@ async def websocket_chat(websocket: WebSocket):
                 await websocket.close(code=1008, reason="Invalid initial message")
                 return
         except (json.JSONDecodeError, KeyError) as e:
-            logger.error(f"Invalid initial message: {e}")
+            logger.error("Invalid initial message: %s", e)
             await websocket.close(code=1008, reason="Invalid initial message format")
             return
 
@@ -106,15 +136,25 @@ async def websocket_chat(websocket: WebSocket):
             try:
                 # Receive message
                 data = await websocket.receive_text()
+                if len(data) > MAX_MESSAGE_LENGTH:
+                    await websocket.send_json(
+                        {"type": "error", "message": "Message too large"}
+                    )
+                    continue
                 message = json.loads(data)
 
                 msg_type = message.get("type")
 
                 if msg_type == "message":
                     # Process user message
-                    text = message.get("text", "")
-                    lesson_id = message.get("lesson_id", "")
-                    dialogue_id = message.get("dialogue_id", "")
+                    try:
+                        text, lesson_id, dialogue_id = (
+                            message["text"],
+                            message["lesson_id"],
+                            message["dialogue_id"],
+                        )
+                    except KeyError:
+                        text = lesson_id = dialogue_id = ""
                     speed = message.get("speed", 1.0)
                     confidence = message.get("confidence")
 
@@ -132,12 +172,11 @@ async def websocket_chat(websocket: WebSocket):
                         {"type": "typing", "message": "Tutor is thinking..."}
                     )
 
-                    # Small delay to show typing indicator
-                    await asyncio.sleep(0.3)
-
-                    # Get tutor response
+                    # Get tutor response off the event loop; respond() does
+                    # blocking DB, file and HTTP work
                     tutor = app_context.tutor
-                    response = tutor.respond(
+                    response = await asyncio.to_thread(
+                        tutor.respond,
                         user_id=user_id,
                         text=text,
                         lesson_id=lesson_id,
@@ -156,6 +195,9 @@ async def websocket_chat(websocket: WebSocket):
                         )
                         continue
 
+                    # A new attempt was recorded, so cached stats are stale
+                    invalidate_user_stats_cache(user_id)
+
                     # Send final response
                     await websocket.send_json(
                         {
@@ -189,7 +231,7 @@ async def websocket_chat(websocket: WebSocket):
                     # Connection closed, break out of loop
                     break
             except Exception as e:
-                logger.error(f"Error processing WebSocket message: {e}", exc_info=True)
+                logger.error("Error processing WebSocket message: %s", e, exc_info=True)
                 try:
                     await websocket.send_json(
                         {"type": "error", "message": f"Internal server error: {str(e)}"}
@@ -202,9 +244,9 @@ async def websocket_chat(websocket: WebSocket):
         # Normal client disconnect
         if user_id:
             manager.disconnect(user_id)
-        logger.info(f"WebSocket disconnected for user {user_id}")
+        logger.info("WebSocket disconnected for user %s", user_id)
     except Exception as e:
-        logger.error(f"WebSocket error: {e}", exc_info=True)
+        logger.error("WebSocket error: %s", e, exc_info=True)
         if user_id:
             manager.disconnect(user_id)
         try:
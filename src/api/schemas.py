@@ -1,25 +1,29 @@
 """Pydantic schemas for API request/response models."""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
 
 from pydantic import BaseModel, Field
 
-
 # =========================================================
 # Base response schema
 # =========================================================
-class APIResponse(BaseModel):
-    """Base API response schema."""
+DataT = TypeVar("DataT")
+
+
+class TypedAPIResponse(BaseModel, Generic[DataT]):
+    """Base API response schema with a typed ``data`` payload."""
 
     status: str = Field(..., description="Response status: 'success' or 'error'")
     message: str = Field(..., description="Human-readable message")
-    data: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = Field(
-        None, description="Response data payload (dict or list of dicts)"
-    )
+    data: Optional[DataT] = Field(None, description="Response data payload")
     metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
 
 
+# Base API response schema; data is a dict or a list of dicts
+APIResponse = TypedAPIResponse[Union[Dict[str, Any], List[Dict[str, Any]]]]
+
+
 # =========================================================
 # Chat endpoints
 # =========================================================
@@ -52,12 +56,11 @@ class ChatRespondData(BaseModel):
     expected_phrase: Optional[str] = None
 
 
-class ChatRespondResponse(APIResponse):
+class ChatRespondResponse(TypedAPIResponse[ChatRespondData]):
     """Response schema for POST /chat/respond."""
 
-    data: Optional[ChatRespondData] = None
     metadata: Optional[Dict[str, Any]] = Field(
-        None, description="Contains attempt_id and timestamp"
+        None, description="Contains attempt_id, timestamp and timestamp_ms"
     )
 
 
@@ -101,11 +104,9 @@ class LessonCatalogData(BaseModel):
     )
 
 
-class LessonCatalogResponse(APIResponse):
+class LessonCatalogResponse(TypedAPIResponse[LessonCatalogData]):
     """Response schema for GET /lesson/catalog."""
 
-    data: Optional[LessonCatalogData] = None
-
 
 # =========================================================
 # Review endpoints
@@ -129,18 +130,30 @@ class ReviewUpdateData(BaseModel):
     interval_days: int = Field(..., description="Review interval in days")
 
 
-class ReviewUpdateResponse(APIResponse):
+class ReviewUpdateResponse(TypedAPIResponse[ReviewUpdateData]):
     """Response schema for POST /review/update."""
 
-    data: Optional[ReviewUpdateData] = None
 
+class ReviewItem(BaseModel):
+    """Single due SRS item for GET /review/get."""
 
-class ReviewGetResponse(APIResponse):
-    """Response schema for GET /review/get."""
-
-    data: Optional[List[Dict[str, Any]]] = Field(
-        None, description="List of due SRS items"
+    phrase_id: str = Field(..., description="Phrase ID")
+    user_id: int = Field(..., description="User ID")
+    next_review: Optional[str] = Field(None, description="ISO 8601 due timestamp")
+    efactor: Optional[float] = Field(None, description="Current ease factor")
+    interval_days: Optional[int] = Field(None, description="Review interval in days")
+    review_count: Optional[int] = Field(None, description="Number of reviews so far")
+    strength_level: Optional[Union[int, float]] = Field(
+        None, description="Memory strength level"
     )
+    phrase_text: Optional[str] = Field(None, description="Phrase text")
+    translation: Optional[str] = Field(None, description="Phrase translation")
+    audio: Optional[str] = Field(None, description="Native audio file name")
+    lesson_id: Optional[str] = Field(None, description="Owning lesson ID")
+
+
+class ReviewGetResponse(TypedAPIResponse[List[ReviewItem]]):
+    """Response schema for GET /review/get."""
 
 
 # =========================================================
@@ -214,12 +227,26 @@ class SettingsUpdateResponse(APIResponse):
 # =========================================================
 # User stats endpoint
 # =========================================================
-class UserStatsResponse(APIResponse):
-    """Response schema for GET /user/stats."""
+class AccuracyTrendPoint(BaseModel):
+    """Single point of the user accuracy trend."""
 
-    data: Optional[Dict[str, Any]] = Field(
-        None, description="User statistics including progress, study time, accuracy"
-    )
+    date: str = Field(..., description="ISO 8601 attempt timestamp")
+    accuracy: float = Field(..., description="Attempt accuracy in percent")
+
+
+class UserStatsData(BaseModel):
+    """Response data for GET /user/stats."""
+
+    user_id: int
+    total_attempts: int
+    progress_percent: float
+    study_time_minutes: float
+    average_accuracy: float
+    accuracy_trend: List[AccuracyTrendPoint] = Field(default_factory=list)
+
+
+class UserStatsResponse(TypedAPIResponse[UserStatsData]):
+    """Response schema for GET /user/stats."""
 
 
 # =========================================================
@@ -248,11 +275,9 @@ class AudioGenerateData(BaseModel):
     )
 
 
-class AudioGenerateResponse(APIResponse):
+class AudioGenerateResponse(TypedAPIResponse[AudioGenerateData]):
     """Response schema for POST /audio/generate."""
 
-    data: Optional[AudioGenerateData] = None
-
 
 # =========================================================
 # Backup endpoint
@@ -278,7 +303,11 @@ class ErrorReportRequest(BaseModel):
     context: Optional[Dict[str, Any]] = Field(None, description="Additional context")
 
 
-class ErrorReportResponse(APIResponse):
-    """Response schema for POST /error/report."""
+class ErrorReportData(BaseModel):
+    """Response data for POST /error/report."""
 
-    data: Optional[Dict[str, Any]] = Field(None, description="Error report ID")
+    reported_at: str = Field(..., description="ISO 8601 timestamp of the report")
+
+
+class ErrorReportResponse(TypedAPIResponse[ErrorReportData]):
+    """Response schema for POST /error/report."""
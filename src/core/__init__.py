@@ -1,7 +1,15 @@
-"""Core application components exposed lazily to avoid circular imports."""
+"""Core application components.
+
+The database primitives have no intra-package dependencies and are
+imported eagerly. The remaining components import ``src.models``, whose
+modules import ``src.core.database`` and therefore this package, so
+they are resolved on first access instead.
+"""
 
 from importlib import import_module
 
+from src.core.database import Base, SessionLocal, engine
+
 __all__ = [
     "AppContext",
     "app_context",
@@ -12,26 +20,18 @@ __all__ = [
     "Tutor",
 ]
 
+_LAZY_ATTRS = {
+    "AppContext": "src.core.app_context",
+    "app_context": "src.core.app_context",
+    "LessonManager": "src.core.lesson_manager",
+    "Tutor": "src.core.tutor",
+}
+
 
 def __getattr__(name):
-    if name in {"AppContext", "app_context"}:
-        module = import_module("src.core.app_context")
-        attr = getattr(module, name)
-        globals()[name] = attr
-        return attr
-    if name in {"Base", "SessionLocal", "engine"}:
-        module = import_module("src.core.database")
-        attr = getattr(module, name)
-        globals()[name] = attr
-        return attr
-    if name == "LessonManager":
-        module = import_module("src.core.lesson_manager")
-        LessonManager = getattr(module, "LessonManager")
-        globals()[name] = LessonManager
-        return LessonManager
-    if name == "Tutor":
-        module = import_module("src.core.tutor")
-        Tutor = getattr(module, "Tutor")
-        globals()[name] = Tutor
-        return Tutor
-    raise AttributeError(name)
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(name)
+    attr = getattr(import_module(module_name), name)
+    globals()[name] = attr
+    return attr
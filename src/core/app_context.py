@@ -1,10 +1,26 @@
 """Application context for dependency injection."""
 
+import functools
+import os
+from pathlib import Path
 from typing import Optional
 
+from dotenv import load_dotenv
+
 from src.core.database import SessionLocal
 from src.core.tutor import Tutor
 from src.services.database_service import Database
+from src.services.speech_engine import SpeechEngine
+from src.services.token_store import TokenStore, create_token_store
+
+BASE_DIR = Path(__file__).resolve().parents[2]
+AUDIO_CACHE_V2_DIR = BASE_DIR / "static" / "audio_cache_v2"
+
+
+@functools.cache
+def _load_dotenv_once() -> None:
+    """Parse .env into os.environ once per process."""
+    load_dotenv()
 
 
 class AppContext:
@@ -17,6 +33,8 @@ class AppContext:
         self._cache_manager = None  # Will be implemented later
         self._tutor: Optional[Tutor] = None
         self._database: Optional[Database] = None
+        self._speech_engine: Optional[SpeechEngine] = None
+        self._token_store: Optional[TokenStore] = None
 
     @property
     def db_session_factory(self):
@@ -27,10 +45,7 @@ class AppContext:
     def config(self) -> dict:
         """Get application configuration."""
         if self._config is None:
-            import os
-            from dotenv import load_dotenv
-
-            load_dotenv()
+            _load_dotenv_once()
             self._config = {
                 "database_url": os.getenv(
                     "DATABASE_URL", "sqlite:///./data/polish_tutor.db"
@@ -39,6 +54,8 @@ class AppContext:
                 "log_level": os.getenv("LOG_LEVEL", "INFO"),
                 "host": os.getenv("HOST", "0.0.0.0"),
                 "port": int(os.getenv("PORT", "8000")),
+                "token_store_backend": os.getenv("TOKEN_STORE_BACKEND", "memory"),
+                "redis_url": os.getenv("REDIS_URL"),
             }
         return self._config
 
@@ -61,6 +78,22 @@ class AppContext:
             self._tutor = Tutor(database=self.database)
         return self._tutor
 
+    @property
+    def speech_engine(self) -> SpeechEngine:
+        """Get SpeechEngine instance backing the v2 audio cache."""
+        if self._speech_engine is None:
+            self._speech_engine = SpeechEngine(cache_dir=str(AUDIO_CACHE_V2_DIR))
+        return self._speech_engine
+
+    @property
+    def token_store(self) -> TokenStore:
+        """Get refresh token store selected by TOKEN_STORE_BACKEND."""
+        if self._token_store is None:
+            self._token_store = create_token_store(
+                self.config["token_store_backend"], self.config["redis_url"]
+            )
+        return self._token_store
+
 
 # Global app context instance
 app_context = AppContext()
@@ -4,19 +4,17 @@ import secrets
 from datetime import datetime, timedelta
 from typing import Optional
 
+import bcrypt
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from pydantic import BaseModel
 
 from src.core.app_context import app_context
 from src.models.user import User
 from src.services.database_service import Database
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # JWT settings from config
 config = app_context.config
 JWT_SECRET_KEY = config.get("jwt_secret_key", "your-secret-key-change-in-production")
@@ -27,6 +25,9 @@ REFRESH_TOKEN_EXPIRE_DAYS = config.get("refresh_token_expire_days", 7)
 # Security scheme
 security = HTTPBearer()
 
+# bcrypt only reads the first 72 bytes of a password
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
 
 class TokenData(BaseModel):
     """JWT token payload data."""
@@ -46,12 +47,21 @@ class TokenResponse(BaseModel):
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return bcrypt.checkpw(
+            plain_password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES],
+            hashed_password.encode("utf-8"),
+        )
+    except ValueError:
+        # Not a bcrypt hash
+        return False
 
 
 def get_password_hash(password: str) -> str:
     """Hash a password for storing."""
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(
+        password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES], bcrypt.gensalt()
+    ).decode("utf-8")
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
@@ -133,7 +143,8 @@ async def get_current_user(
 
         # Expunge from session so it can be used outside
         session.expunge(user)
-        return user
+
+    return user
 
 
 async def get_current_user_optional(
@@ -166,21 +177,21 @@ def authenticate_user(
         return user
 
 
-# Simple in-memory session store for refresh tokens
-# In production, this should be Redis or database-backed
-_refresh_token_store = {}
+# Refresh tokens live in app_context.token_store (in-memory by default,
+# Redis when TOKEN_STORE_BACKEND=redis so all workers share them)
+REFRESH_TOKEN_TTL_SECONDS = REFRESH_TOKEN_EXPIRE_DAYS * 86400
 
 
 def store_refresh_token(user_id: int, refresh_token: str):
-    """Store a refresh token for a user (in-memory for now)."""
-    _refresh_token_store[user_id] = refresh_token
+    """Store a refresh token for a user."""
+    app_context.token_store.set(user_id, refresh_token, REFRESH_TOKEN_TTL_SECONDS)
 
 
 def get_refresh_token(user_id: int) -> Optional[str]:
     """Get stored refresh token for a user."""
-    return _refresh_token_store.get(user_id)
+    return app_context.token_store.get(user_id)
 
 
 def revoke_refresh_token(user_id: int):
     """Revoke refresh token for a user."""
-    _refresh_token_store.pop(user_id, None)
+    app_context.token_store.revoke(user_id)
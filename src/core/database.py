@@ -1,23 +1,47 @@
 """Database connection and session management."""
 
+import logging
 import os
-from typing import Generator
+from typing import Any, Dict, Generator
 
 from dotenv import load_dotenv
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import declarative_base, sessionmaker
 
+logger = logging.getLogger(__name__)
+
 # Load environment variables
 load_dotenv()
 
 # Database URL from environment
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./data/polish_tutor.db")
 
+# Server databases get a pool sized for the request threadpool, with stale
+# connections recycled and checked before use; SQLite keeps its defaults
+if "sqlite" in DATABASE_URL:
+    engine_options: Dict[str, Any] = {"connect_args": {"check_same_thread": False}}
+else:
+    engine_options = {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "20")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "40")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "3600")),
+        "pool_pre_ping": True,
+    }
+
 # Create engine with SQLite-specific settings
 engine = create_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
     echo=False,  # Set to True for SQL query logging
+    **engine_options,
+)
+
+# Per-connection SQLite tuning: WAL lets readers proceed during writes and,
+# with synchronous=NORMAL, avoids an fsync on every commit
+SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
 )
 
 # Enable foreign key constraints for SQLite
@@ -27,6 +51,13 @@ if "sqlite" in DATABASE_URL:
     def set_sqlite_pragma(dbapi_conn, connection_record):
         cursor = dbapi_conn.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA journal_mode=WAL")
+        journal_mode = cursor.fetchone()
+        if not journal_mode or str(journal_mode[0]).lower() != "wal":
+            # In-memory databases keep their own journal mode
+            logger.debug(f"SQLite journal_mode is {journal_mode}, not WAL")
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
         cursor.close()
 
 
@@ -8,15 +8,18 @@ from dotenv import load_dotenv
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
-from alembic.config import Config
-from alembic import command
-
 from src.core.database import engine, Base
-from src.models import *  # noqa: F401, F403
 
 
 def init_database():
     """Initialize database by running migrations."""
+    # Alembic and the ORM models are only needed when migrations actually
+    # run, so importing this module stays cheap
+    from alembic.config import Config
+    from alembic import command
+
+    import src.models  # noqa: F401
+
     # Load environment variables
     load_dotenv()
 
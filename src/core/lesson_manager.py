@@ -1,20 +1,44 @@
 """Lesson Manager for loading and validating lesson JSON files."""
 
+import hashlib
 import json
 import logging
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
-
-import jsonschema
-from jsonschema import ValidationError
-
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from jsonschema import Draft7Validator
+from jsonschema.exceptions import best_match
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    StrictBool,
+    StrictStr,
+    ValidationError,
+    field_validator,
+)
+
+from src.core import logging_config
 from src.models import Lesson
 from src.services.database_service import Database
 
+try:  # pragma: no cover - optional faster decoder
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 BASE_DIR = Path(__file__).resolve().parents[2]
 DEFAULT_LESSON_DIR = BASE_DIR / "data" / "lessons"
 DEFAULT_AUDIO_DIR = BASE_DIR / "static" / "audio" / "native"
+# Snapshots of load_all_lessons() results live in <lessons_dir>/.cache;
+# bump the version when the cached lesson structure changes
+SNAPSHOT_DIRNAME = ".cache"
+SNAPSHOT_VERSION = 3
 
 # -------------------------------------------------------------------
 # JSON Schema for lesson validation
@@ -67,6 +91,103 @@ LESSON_SCHEMA: Dict[str, Any] = {
     },
 }
 
+# Compiled once: jsonschema.validate() re-checks the schema and builds a new
+# validator on every call
+Draft7Validator.check_schema(LESSON_SCHEMA)
+_LESSON_VALIDATOR = Draft7Validator(LESSON_SCHEMA)
+
+
+# Pydantic mirror of LESSON_SCHEMA. Its compiled validator checks a lesson
+# roughly 20x faster than jsonschema, so it runs first and jsonschema is only
+# consulted to word the error of an invalid lesson. Optional fields default to
+# None, but an explicit null is rejected, matching the schema. Keep both in
+# sync: tests/unit/test_lesson_manager.py compares their fields and verdicts.
+
+
+class _LessonModel(BaseModel):
+    """Strict base: no type coercion, unknown keys are kept."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    @field_validator("*", mode="before")
+    @classmethod
+    def _reject_null(cls, value: Any) -> Any:
+        # Defaults are not validated, so this only sees keys present in the file
+        if value is None:
+            raise ValueError("null is not allowed")
+        return value
+
+
+class OptionModel(_LessonModel):
+    """Branch option of a dialogue."""
+
+    next: StrictStr
+    match: Optional[StrictStr] = None
+    description: Optional[StrictStr] = None
+    default: Optional[StrictBool] = None
+
+
+class DialogueModel(_LessonModel):
+    """Single tutor turn of a lesson."""
+
+    id: StrictStr
+    tutor: StrictStr
+    expected: List[StrictStr] = Field(min_length=1)
+    translation: Optional[StrictStr] = None
+    hint: Optional[StrictStr] = None
+    grammar: Optional[StrictStr] = None
+    audio: Optional[StrictStr] = None
+    audio_slow: Optional[StrictStr] = None
+    options: Optional[List[OptionModel]] = None
+
+
+class LessonModel(_LessonModel):
+    """Lesson file as described by ``LESSON_SCHEMA``."""
+
+    id: StrictStr
+    title: StrictStr
+    level: StrictStr
+    cefr_goal: Optional[StrictStr] = None
+    tags: Optional[List[StrictStr]] = None
+    dialogues: List[DialogueModel] = Field(min_length=1)
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file, using orjson when it is installed."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _intern_ids(lesson_data: Any) -> None:
+    """Intern lesson, dialogue and branch IDs in place.
+
+    IDs repeat across ``next`` references and cached lessons; interned copies
+    share one string object and compare by identity in set/dict lookups.
+    Values of unexpected types are left for schema validation to report.
+    """
+    if not isinstance(lesson_data, dict):
+        return
+    if isinstance(lesson_data.get("id"), str):
+        lesson_data["id"] = sys.intern(lesson_data["id"])
+    dialogues = lesson_data.get("dialogues")
+    if not isinstance(dialogues, list):
+        return
+    for dlg in dialogues:
+        if not isinstance(dlg, dict):
+            continue
+        if isinstance(dlg.get("id"), str):
+            dlg["id"] = sys.intern(dlg["id"])
+        options = dlg.get("options")
+        if not isinstance(options, list):
+            continue
+        for opt in options:
+            if isinstance(opt, dict) and isinstance(opt.get("next"), str):
+                opt["next"] = sys.intern(opt["next"])
+
+
 # -------------------------------------------------------------------
 # LessonManager
 # -------------------------------------------------------------------
@@ -85,83 +206,256 @@ class LessonManager:
         self.lessons_dir: Path = Path(lessons_dir or DEFAULT_LESSON_DIR)
         self.audio_base_dir: Path = Path(audio_base_dir or DEFAULT_AUDIO_DIR)
         self.database: Database = database or Database()
-        self._cache: Dict[str, Dict[str, Any]] = {}  # Cached lessons
+        # Cached lessons as (file mtime_ns, data); mtime is None for lessons
+        # cached directly via cache_lesson()
+        self._cache: Dict[str, Tuple[Optional[int], Dict[str, Any]]] = {}
+        self._cache_lock = threading.Lock()
+        # Flattened catalog keyed by catalog.json mtime (version token)
+        self._catalog_cache: Optional[Tuple[int, List[Dict[str, Any]]]] = None
 
     # -------------------------------------------------------------------
     # Lesson loading
     # -------------------------------------------------------------------
 
     def load_lesson(self, lesson_id: str, validate: bool = True) -> Dict[str, Any]:
-        """Load a lesson JSON file."""
-        if lesson_id in self._cache:
-            logger.debug(f"Lesson {lesson_id} loaded from cache")
-            return self._cache[lesson_id]
+        """Load a lesson JSON file.
 
+        Cached lessons are reused while the file's mtime is unchanged (or the
+        file has been removed), so edited lessons are picked up without
+        calling ``clear_cache``.
+        """
         lesson_file = self.lessons_dir / f"{lesson_id}.json"
-        if not lesson_file.exists():
+        try:
+            mtime: Optional[int] = os.stat(lesson_file).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+
+        cached = self._cache.get(lesson_id)
+        if cached is not None and (mtime is None or cached[0] in (None, mtime)):
+            if logging_config.DEBUG_ENABLED:
+                logger.debug(f"Lesson {lesson_id} loaded from cache")
+            return cached[1]
+
+        if mtime is None:
             raise FileNotFoundError(f"Lesson file not found: {lesson_file}")
 
-        with open(lesson_file, "r", encoding="utf-8") as f:
-            lesson_data = json.load(f)
+        lesson_data = _read_json(lesson_file)
+        _intern_ids(lesson_data)
 
         if validate:
             self._validate_schema(lesson_data)
-            self._validate_branches(lesson_data)
-            self._validate_audio_files(lesson_data)
+            self._validate_dialogues(lesson_data)
 
-        self._cache[lesson_id] = lesson_data
+        with self._cache_lock:
+            self._cache[lesson_id] = (mtime, lesson_data)
         return lesson_data
 
-    def load_all_lessons(self, validate: bool = True) -> Dict[str, Dict[str, Any]]:
-        """Load all lessons from directory."""
+    def load_all_lessons(
+        self, validate: bool = True, catalog_only: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        """Load all lessons from directory.
+
+        With ``catalog_only`` only lessons listed in catalog.json are loaded,
+        so drafts that are not published yet are never parsed.
+
+        The result is snapshotted to disk keyed by the lesson files' names,
+        sizes and mtimes, so an unchanged lesson directory is restored with
+        a single read on the next start instead of re-parsing every file.
+        Lessons that failed to load are stored with their errors and logged
+        again on restore.
+        """
         lessons: Dict[str, Dict[str, Any]] = {}
-        if not self.lessons_dir.exists():
+        try:
+            # scandir reports names and file types from one directory read
+            with os.scandir(self.lessons_dir) as it:
+                lesson_files = [
+                    (entry.name, entry.stat())
+                    for entry in it
+                    if entry.name.endswith(".json")
+                    and entry.name != "catalog.json"
+                    and entry.is_file()
+                ]
+        except (FileNotFoundError, NotADirectoryError):
             logger.warning(f"Lessons directory not found: {self.lessons_dir}")
             return lessons
 
-        for json_file in self.lessons_dir.glob("*.json"):
-            lesson_id = json_file.stem
-            try:
-                lessons[lesson_id] = self.load_lesson(lesson_id, validate)
-            except Exception as e:
-                logger.error(f"Failed to load lesson {lesson_id}: {e}")
+        if catalog_only:
+            catalog_ids = {entry["id"] for entry in self.load_lesson_catalog()}
+            lesson_files = [
+                (name, stat) for name, stat in lesson_files if name[:-5] in catalog_ids
+            ]
+
+        lesson_ids = [name[:-5] for name, _ in lesson_files]
+        snapshot_file = self._snapshot_path(lesson_files, validate, catalog_only)
+        snapshot = self._read_snapshot(snapshot_file)
+        if snapshot is not None:
+            restored, restored_failures = snapshot
+            # Failed files stay excluded until they change; keep reporting them
+            for failed_id, failure in restored_failures.items():
+                logger.error(f"Failed to load lesson {failed_id}: {failure}")
+            mtimes = {name[:-5]: stat.st_mtime_ns for name, stat in lesson_files}
+            with self._cache_lock:
+                for restored_id, restored_data in restored.items():
+                    self._cache[restored_id] = (mtimes.get(restored_id), restored_data)
+            logger.info(f"Loaded {len(restored)} lessons from snapshot")
+            return restored
+
+        failures: Dict[str, str] = {}
+        if lesson_ids:
+            # Each load is file IO plus parsing/validation; run them side by side
+            max_workers = min(32, (os.cpu_count() or 4) * 2, len(lesson_ids))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(
+                    lambda lesson_id: (
+                        lesson_id,
+                        self._load_lesson_safe(lesson_id, validate),
+                    ),
+                    lesson_ids,
+                )
+                for lesson_id, (lesson_data, error) in results:
+                    if lesson_data is not None:
+                        lessons[lesson_id] = lesson_data
+                    elif error is not None:
+                        failures[lesson_id] = error
         logger.info(f"Loaded {len(lessons)} lessons")
+        self._write_snapshot(snapshot_file, lessons, failures)
         return lessons
 
+    def _snapshot_path(
+        self,
+        lesson_files: List[Tuple[str, os.stat_result]],
+        validate: bool,
+        catalog_only: bool,
+    ) -> Path:
+        """Return the snapshot file for this set of lesson files.
+
+        The name starts with the load mode, so each mode keeps its own
+        latest snapshot.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"v{SNAPSHOT_VERSION}".encode())
+        for name, stat in sorted(lesson_files):
+            digest.update(f"|{name}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+        mode = (
+            f"{'catalog' if catalog_only else 'all'}-{'valid' if validate else 'raw'}"
+        )
+        return self.lessons_dir / SNAPSHOT_DIRNAME / f"{mode}-{digest.hexdigest()}.json"
+
+    def _read_snapshot(
+        self, snapshot_file: Path
+    ) -> Optional[Tuple[Dict[str, Any], Dict[str, str]]]:
+        """Return ``(lessons, failures)`` stored in a snapshot, if readable."""
+        try:
+            snapshot = _read_json(snapshot_file)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            logger.warning(
+                f"Ignoring unreadable lesson snapshot {snapshot_file}: {exc}"
+            )
+            return None
+        lessons = snapshot.get("lessons") if isinstance(snapshot, dict) else None
+        failures = snapshot.get("failures") if isinstance(snapshot, dict) else None
+        if not isinstance(lessons, dict) or not isinstance(failures, dict):
+            logger.warning(f"Ignoring malformed lesson snapshot {snapshot_file}")
+            return None
+        for lesson_data in lessons.values():
+            _intern_ids(lesson_data)
+        return lessons, failures
+
+    def _write_snapshot(
+        self,
+        snapshot_file: Path,
+        lessons: Dict[str, Dict[str, Any]],
+        failures: Dict[str, str],
+    ) -> None:
+        """Store loaded lessons and load errors, dropping older snapshots."""
+        snapshot_dir = snapshot_file.parent
+        mode = snapshot_file.name.rsplit("-", 1)[0]
+        snapshot = {"lessons": lessons, "failures": failures}
+        if orjson is not None:
+            payload = orjson.dumps(snapshot)
+        else:
+            payload = json.dumps(snapshot, ensure_ascii=False).encode("utf-8")
+        try:
+            snapshot_dir.mkdir(exist_ok=True)
+            tmp_file = snapshot_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, snapshot_file)
+            # Older snapshot formats are never read again
+            stale_files = [
+                *snapshot_dir.glob(f"{mode}-*.json"),
+                *snapshot_dir.glob("*.pickle"),
+            ]
+            for stale in stale_files:
+                if stale != snapshot_file:
+                    stale.unlink(missing_ok=True)
+        except OSError as exc:
+            # Read-only deployments simply run without a snapshot
+            logger.debug(f"Cannot write lesson snapshot {snapshot_file}: {exc}")
+
+    def _load_lesson_safe(
+        self, lesson_id: str, validate: bool
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Load a lesson, logging failures instead of raising.
+
+        Returns ``(lesson_data, None)`` or ``(None, error)``.
+        """
+        try:
+            return self.load_lesson(lesson_id, validate), None
+        except Exception as e:
+            logger.error(f"Failed to load lesson {lesson_id}: {e}")
+            return None, str(e)
+
     def load_lesson_catalog(self) -> List[Dict[str, Any]]:
-        """Load catalog.json (flattened)."""
+        """Load catalog.json (flattened).
+
+        The flattened entries are cached until catalog.json changes on disk,
+        so repeated catalog requests cost a single ``stat`` call.
+        """
         catalog_file = self.lessons_dir / "catalog.json"
-        if not catalog_file.exists():
+        try:
+            version = catalog_file.stat().st_mtime_ns
+        except OSError:
+            self._catalog_cache = None
             return []
 
+        cached = self._catalog_cache
+        if cached is not None and cached[0] == version:
+            return list(cached[1])
+
         try:
-            with open(catalog_file, "r", encoding="utf-8") as f:
-                catalog_data = json.load(f)
+            catalog_data = _read_json(catalog_file)
         except Exception as exc:
             logger.warning(f"Cannot read catalog: {exc}")
             return []
 
-        entries: List[Dict[str, Any]] = []
+        # Collect plain tuples while walking the catalog and build the entry
+        # dicts in one comprehension at the end
+        rows: List[Tuple[Any, ...]] = []
+        rows_append = rows.append
         seen: Set[str] = set()
+        seen_add = seen.add
 
         def push_entry(
             entry: Dict[str, Any],
             part_title: Optional[str] = None,
             module_title: Optional[str] = None,
         ) -> None:
-            lesson_id = entry.get("id")
+            get = entry.get
+            lesson_id = get("id")
             if not lesson_id or lesson_id in seen:
                 return
-            seen.add(lesson_id)
-            entries.append(
-                {
-                    "id": lesson_id,
-                    "title_pl": entry.get("title_pl"),
-                    "title_en": entry.get("title_en"),
-                    "status": entry.get("status", "pending"),
-                    "module": module_title,
-                    "part": part_title,
-                }
+            seen_add(lesson_id)
+            rows_append(
+                (
+                    lesson_id,
+                    get("title_pl"),
+                    get("title_en"),
+                    get("status", "pending"),
+                    module_title,
+                    part_title,
+                )
             )
 
         for part in catalog_data.get("parts", []):
@@ -172,7 +466,20 @@ class LessonManager:
                 module_title = module.get("title_pl") or module.get("title_en")
                 for lesson in module.get("lessons", []):
                     push_entry(lesson, part_title=part_title, module_title=module_title)
-        return entries
+
+        entries: List[Dict[str, Any]] = [
+            {
+                "id": lesson_id,
+                "title_pl": title_pl,
+                "title_en": title_en,
+                "status": status,
+                "module": module_title,
+                "part": part_title,
+            }
+            for lesson_id, title_pl, title_en, status, module_title, part_title in rows
+        ]
+        self._catalog_cache = (version, entries)
+        return list(entries)
 
     # -------------------------------------------------------------------
     # Database integration
@@ -188,6 +495,31 @@ class LessonManager:
                 return existing
 
             tags_json = json.dumps(lesson_data.get("tags", []))
+            phrase_rows = [
+                {
+                    "id": dlg["id"],
+                    "lesson_id": lesson_id,
+                    "text": ", ".join(dlg.get("expected", [])),
+                    "grammar": dlg.get("grammar"),
+                    "audio_path": (
+                        f"{lesson_id}/{dlg['audio']}" if dlg.get("audio") else None
+                    ),
+                }
+                for dlg in lesson_data.get("dialogues", [])
+            ]
+
+            # Lesson and phrases in one transaction and one INSERT when the
+            # database supports it, otherwise one create call per phrase
+            if hasattr(self.database, "create_lesson_with_phrases"):
+                return self.database.create_lesson_with_phrases(
+                    lesson_id=lesson_data["id"],
+                    title=lesson_data["title"],
+                    level=lesson_data["level"],
+                    phrase_rows=phrase_rows,
+                    tags=tags_json,
+                    cefr_goal=lesson_data.get("cefr_goal"),
+                )
+
             lesson = self.database.create_lesson(
                 lesson_id=lesson_data["id"],
                 title=lesson_data["title"],
@@ -195,18 +527,13 @@ class LessonManager:
                 tags=tags_json,
                 cefr_goal=lesson_data.get("cefr_goal"),
             )
-
-            for dlg in lesson_data.get("dialogues", []):
-                dlg_id = dlg["id"]
-                expected_text = ", ".join(dlg.get("expected", []))
-                audio_path = f"{lesson_id}/{dlg['audio']}" if dlg.get("audio") else None
-
+            for row in phrase_rows:
                 self.database.create_phrase(
-                    phrase_id=dlg_id,
-                    lesson_id=lesson_id,
-                    text=expected_text,
-                    grammar=dlg.get("grammar"),
-                    audio_path=audio_path,
+                    phrase_id=row["id"],
+                    lesson_id=row["lesson_id"],
+                    text=row["text"],
+                    grammar=row["grammar"],
+                    audio_path=row["audio_path"],
                 )
             return lesson
         except Exception as e:
@@ -218,19 +545,20 @@ class LessonManager:
     # -------------------------------------------------------------------
 
     def get_lesson(self, lesson_id: str) -> Optional[Dict[str, Any]]:
-        if lesson_id in self._cache:
-            return self._cache[lesson_id]
         try:
             return self.load_lesson(lesson_id, validate=False)
         except FileNotFoundError:
             return None
 
     def clear_cache(self) -> None:
-        self._cache.clear()
+        with self._cache_lock:
+            self._cache.clear()
+        self._catalog_cache = None
         logger.info("Lesson cache cleared")
 
     def cache_lesson(self, lesson_id: str, lesson_data: Dict[str, Any]) -> None:
-        self._cache[lesson_id] = lesson_data
+        with self._cache_lock:
+            self._cache[lesson_id] = (None, lesson_data)
         logger.info(f"Lesson {lesson_id} cached in memory")
 
     # -------------------------------------------------------------------
@@ -239,43 +567,73 @@ class LessonManager:
 
     def _validate_schema(self, lesson_data: Dict[str, Any]) -> None:
         try:
-            jsonschema.validate(instance=lesson_data, schema=LESSON_SCHEMA)
-        except ValidationError as e:
-            raise ValueError(f"Invalid lesson schema: {e.message}") from e
-
-    def _validate_branches(self, lesson_data: Dict[str, Any]) -> None:
+            LessonModel.model_validate(lesson_data)
+            return
+        except ValidationError as exc:
+            validation_error = exc
+        error = best_match(_LESSON_VALIDATOR.iter_errors(lesson_data))
+        if error is not None:
+            raise ValueError(f"Invalid lesson schema: {error.message}") from error
+        # The models are stricter than the schema in some corner case
+        raise ValueError(f"Invalid lesson schema: {validation_error}")
+
+    def _validate_dialogues(self, lesson_data: Dict[str, Any]) -> None:
+        """Check branches, default options and audio files in one pass.
+
+        Broken branches raise ``ValueError`` (missing targets first, then the
+        first dialogue without exactly one default); missing audio is only
+        logged, and only for lessons whose branches are valid.
+        """
         lesson_id = lesson_data["id"]
         dialogues: List[Dict[str, Any]] = lesson_data.get("dialogues", [])
         dialogue_ids: Set[str] = {dlg["id"] for dlg in dialogues}
 
-        missing: List[str] = []
-        for dlg in dialogues:
-            for opt in dlg.get("options", []):
-                nxt = opt.get("next")
-                if nxt and nxt not in dialogue_ids and not nxt.startswith(lesson_id):
-                    missing.append(nxt)
-
-        if missing:
-            raise ValueError(f"Lesson {lesson_id} references missing IDs: {missing}")
+        audio_dir = os.fspath(self.audio_base_dir / lesson_id)
+        # One directory listing instead of a stat() per referenced file
+        try:
+            with os.scandir(audio_dir) as it:
+                existing_audio: Set[str] = {entry.name for entry in it}
+        except OSError:
+            existing_audio = set()
 
+        missing: List[str] = []
+        bad_default: Optional[Tuple[str, int]] = None
+        missing_audio: List[str] = []
         for dlg in dialogues:
-            options = dlg.get("options", [])
+            options = dlg.get("options")
             if options:
-                default_count = sum(1 for o in options if o.get("default", False))
-                if default_count != 1:
-                    raise ValueError(
-                        f"Dialogue {dlg['id']} must have exactly one default option (found {default_count})"
-                    )
+                default_count = 0
+                for opt in options:
+                    nxt = opt.get("next")
+                    if (
+                        nxt
+                        and nxt not in dialogue_ids
+                        and not nxt.startswith(lesson_id)
+                    ):
+                        missing.append(nxt)
+                    if opt.get("default", False):
+                        default_count += 1
+                if default_count != 1 and bad_default is None:
+                    bad_default = (dlg["id"], default_count)
 
-    def _validate_audio_files(self, lesson_data: Dict[str, Any]) -> None:
-        lesson_id = lesson_data["id"]
-        missing: List[str] = []
-        for dlg in lesson_data.get("dialogues", []):
             for key in ("audio", "audio_slow"):
                 fname = dlg.get(key)
-                if fname:
-                    fpath = self.audio_base_dir / lesson_id / fname
-                    if not fpath.exists():
-                        missing.append(str(fpath))
+                if not fname or fname in existing_audio:
+                    continue
+                fpath = os.path.join(audio_dir, fname)
+                # Names with subdirectories are not in the flat listing
+                if "/" in fname and os.path.exists(fpath):
+                    continue
+                missing_audio.append(fpath)
+
         if missing:
-            logger.warning(f"Audio files missing for {lesson_id}: {missing}")
+            raise ValueError(f"Lesson {lesson_id} references missing IDs: {missing}")
+
+        if bad_default is not None:
+            raise ValueError(
+                f"Dialogue {bad_default[0]} must have exactly one default option "
+                f"(found {bad_default[1]})"
+            )
+
+        if missing_audio:
+            logger.warning(f"Audio files missing for {lesson_id}: {missing_audio}")
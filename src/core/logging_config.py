@@ -1,15 +1,72 @@
 """Structured logging configuration with JSON output and correlation IDs."""
 
+import atexit
 import json
 import logging
 import os
+import queue
 import sys
-import threading
-from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from contextvars import ContextVar, Token
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+try:  # pragma: no cover - optional faster encoder
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+# Naive UTC timestamps are written as "...Z", like isoformat() + "Z"
+_ORJSON_OPTIONS = (
+    orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+    if orjson is not None
+    else 0
+)
+
+# PID reported in JSON entries; LogRecord's per-record os.getpid() is turned
+# off in setup_structured_logging. Refreshed in forked worker processes.
+_PID = os.getpid()
+
+
+def _refresh_pid() -> None:
+    global _PID
+    _PID = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_refresh_pid)
+
+# Context fields promoted to top-level keys of each JSON entry
+_CONTEXT_ATTRS = ("correlation_id", "user_id", "request_id", "job_id")
+
+# LogRecord attributes that are not reported as extra_* fields
+_RESERVED_KEYS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "message",
+    }
+).union(_CONTEXT_ATTRS)
+
 
 class StructuredJSONFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
@@ -20,61 +77,66 @@ class StructuredJSONFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
-        log_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+        log_entry = self._build_entry(record)
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    log_entry, default=str, option=_ORJSON_OPTIONS
+                ).decode()
+            except TypeError:
+                # e.g. integers beyond 64 bits; let the stdlib encoder cope
+                pass
+        log_entry["timestamp"] = log_entry["timestamp"].isoformat() + "Z"
+        return json.dumps(log_entry, default=str, separators=(",", ":"))
+
+    def format_bytes(self, record: logging.LogRecord) -> bytes:
+        """Format log record as UTF-8 JSON for handlers that write bytes."""
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    self._build_entry(record), default=str, option=_ORJSON_OPTIONS
+                )
+            except TypeError:
+                pass
+        return self.format(record).encode()
+
+    def _build_entry(self, record: logging.LogRecord) -> Dict[str, Any]:
+        log_entry: Dict[str, Any] = {
+            # When the event happened, not when the listener thread formats it
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).replace(
+                tzinfo=None
+            ),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
             "module": record.module,
             "function": record.funcName,
             "line": record.lineno,
-            "process": record.process,
+            "process": _PID,
             "thread": record.thread,
             "thread_name": record.threadName,
         }
 
         # Add contextual IDs if present
-        for attr in ("correlation_id", "user_id", "request_id", "job_id"):
+        for attr in _CONTEXT_ATTRS:
             value = getattr(record, attr, None)
             if value:
                 log_entry[attr] = value
 
         # Add extra fields
-        if self.include_extra and hasattr(record, "__dict__"):
-            for key, value in record.__dict__.items():
-                if key not in {
-                    "name",
-                    "msg",
-                    "args",
-                    "levelname",
-                    "levelno",
-                    "pathname",
-                    "filename",
-                    "module",
-                    "exc_info",
-                    "exc_text",
-                    "stack_info",
-                    "lineno",
-                    "funcName",
-                    "created",
-                    "msecs",
-                    "relativeCreated",
-                    "thread",
-                    "threadName",
-                    "processName",
-                    "process",
-                    "message",
-                    "correlation_id",
-                    "user_id",
-                    "request_id",
-                    "job_id",
-                }:
-                    log_entry[f"extra_{key}"] = value
+        if self.include_extra:
+            # Most records carry no extras; one C-level superset check finds
+            # that out without testing every attribute in Python
+            record_dict = record.__dict__
+            if not _RESERVED_KEYS.issuperset(record_dict):
+                for key, value in record_dict.items():
+                    if key not in _RESERVED_KEYS:
+                        log_entry[f"extra_{key}"] = value
 
         if record.exc_info:
             log_entry["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_entry, default=str, separators=(",", ":"))
+        return log_entry
 
 
 class RequiredContextFilter(logging.Filter):
@@ -106,40 +168,164 @@ class ContextAdapter(logging.LoggerAdapter):
         return msg, kwargs
 
 
-# Thread-local storage for correlation/request IDs
-_local = threading.local()
+class _ListenerQueueHandler(QueueHandler):
+    """Queue handler feeding the background listener started by setup.
+
+    The queue is bounded (``LOG_QUEUE_MAXSIZE``). When it is full, records
+    below WARNING are dropped so a slow sink never stalls request handling;
+    WARNING and above block until the listener frees a slot, so errors are
+    never lost. Dropped records are counted and reported with the next
+    record that fits.
+    """
+
+    def __init__(self, queue_: queue.Queue) -> None:
+        super().__init__(queue_)
+        # QueueHandler types ``queue`` as a put_nowait-only protocol
+        self._bounded: queue.Queue = queue_
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.dropped:
+            try:
+                self._bounded.put_nowait(self._dropped_record())
+            except queue.Full:
+                pass
+            else:
+                self.dropped = 0
+        if record.levelno >= logging.WARNING:
+            self._bounded.put(record)
+            return
+        try:
+            self._bounded.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def _dropped_record(self) -> logging.LogRecord:
+        record = logging.LogRecord(
+            __name__,
+            logging.WARNING,
+            __file__,
+            0,
+            "Log queue full; dropped %d records",
+            (self.dropped,),
+            None,
+        )
+        record.correlation_id = None
+        record.request_id = None
+        return record
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The listener runs in this process, so the record is handed over
+        # as-is and the real handlers format it (keeping exc_info for JSON).
+        # Request context is only visible here, on the logging task, so the
+        # IDs are stamped onto the record before it changes threads.
+        if getattr(record, "correlation_id", None) is None:
+            record.correlation_id = _correlation_id.get()
+        if getattr(record, "request_id", None) is None:
+            record.request_id = _request_id.get()
+        return record
+
+    def flush(self) -> None:
+        """Block until the listener has written every queued record."""
+        if _listener is not None:
+            self._bounded.join()
+
+
+class _Listener(QueueListener):
+    """Listener whose stop() waits for room in the bounded queue."""
+
+    # Set on QueueListener at runtime but missing from its type stubs
+    _sentinel: Any = None
+
+    def __init__(self, queue_: queue.Queue, *handlers: logging.Handler, **kwargs: Any):
+        super().__init__(queue_, *handlers, **kwargs)
+        self._bounded: queue.Queue = queue_
+
+    def enqueue_sentinel(self) -> None:
+        # The default put_nowait would raise if the queue is full at shutdown
+        self._bounded.put(self._sentinel)
+
+
+# Maximum number of records waiting for the listener thread
+LOG_QUEUE_MAXSIZE = 10_000
+
+# Background listener owning the file/console handlers
+_listener: Optional[QueueListener] = None
+
+# Whether setup_structured_logging configured DEBUG level. Hot loops can
+# guard debug calls with ``if logging_config.DEBUG_ENABLED:`` so message
+# arguments (f-strings, reprs) are not even built when DEBUG is off.
+DEBUG_ENABLED = False
+
+
+def _stop_listener() -> None:
+    """Drain the log queue and close the handlers of the running listener."""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(_stop_listener)
+
+
+# Correlation/request IDs of the current request. Unlike thread-locals,
+# context variables are isolated per asyncio task, so concurrent requests
+# served by one event loop thread do not see each other's IDs.
+_correlation_id: ContextVar[Optional[str]] = ContextVar("correlation_id", default=None)
+_request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
 
 
 def get_correlation_id() -> Optional[str]:
-    return getattr(_local, "correlation_id", None)
+    return _correlation_id.get()
+
+
+def set_correlation_id(correlation_id: str) -> Token:
+    """Set the correlation ID; pass the token to reset_correlation_id()."""
+    return _correlation_id.set(correlation_id)
 
 
-def set_correlation_id(correlation_id: str) -> None:
-    _local.correlation_id = correlation_id
+def reset_correlation_id(token: Token) -> None:
+    _correlation_id.reset(token)
 
 
 def generate_correlation_id() -> str:
-    import uuid
+    """Return a random RFC 4122 version 4 UUID string.
 
-    return str(uuid.uuid4())
+    Formats os.urandom() bytes directly, about three times faster than
+    ``str(uuid.uuid4())``, which builds a UUID object first.
+    """
+    h = os.urandom(16).hex()
+    variant = "89ab"[int(h[16], 16) & 3]
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{variant}{h[17:20]}-{h[20:]}"
 
 
 def get_request_id() -> Optional[str]:
-    return getattr(_local, "request_id", None)
+    return _request_id.get()
 
 
-def set_request_id(request_id: str) -> None:
-    _local.request_id = request_id
+def set_request_id(request_id: str) -> Token:
+    """Set the request ID; pass the token to reset_request_id()."""
+    return _request_id.set(request_id)
+
+
+def reset_request_id(token: Token) -> None:
+    _request_id.reset(token)
 
 
 def get_logger(name: str) -> ContextAdapter:
     """Get a logger wrapped with context adapter."""
     logger = logging.getLogger(name)
     context = {}
-    if get_correlation_id():
-        context["correlation_id"] = get_correlation_id()
-    if get_request_id():
-        context["request_id"] = get_request_id()
+    correlation_id = get_correlation_id()
+    if correlation_id:
+        context["correlation_id"] = correlation_id
+    request_id = get_request_id()
+    if request_id:
+        context["request_id"] = request_id
     return ContextAdapter(logger, context)
 
 
@@ -157,10 +343,20 @@ def setup_structured_logging(
         "on",
     }
 
+    global _listener, DEBUG_ENABLED
+
     logger = logging.getLogger()
     logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
+    DEBUG_ENABLED = logger.isEnabledFor(logging.DEBUG)
     logger.handlers.clear()
+    _stop_listener()
+    # No formatter here reads record.process/processName; skip collecting
+    # them for every record (thread IDs are still needed, since records are
+    # formatted on the listener thread)
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
     context_filter = RequiredContextFilter()
+    handlers: list[logging.Handler] = []
 
     file_handler_configured = False
     if not disable_file_logs:
@@ -182,7 +378,7 @@ def setup_structured_logging(
                     )
                 )
             file_handler.addFilter(context_filter)
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
             file_handler_configured = True
         except PermissionError:
             logger.warning(
@@ -205,7 +401,15 @@ def setup_structured_logging(
                 )
             )
         console_handler.addFilter(context_filter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+
+    # Callers only enqueue records; disk and console writes happen on the
+    # listener thread. The queue is bounded so a stalled sink cannot grow
+    # memory without limit; see _ListenerQueueHandler for the full policy.
+    log_queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_MAXSIZE)
+    _listener = _Listener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    logger.addHandler(_ListenerQueueHandler(log_queue))
 
     # ✅ FIXED SECTION — safe info log (no invalid `extra` keys)
     logger.info(
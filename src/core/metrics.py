@@ -1,7 +1,9 @@
 """Prometheus metrics instrumentation for FastAPI and RQ monitoring."""
 
-import time
-from typing import Callable, Optional
+import re
+from time import perf_counter
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
 from fastapi import Request, Response
 from prometheus_client import (
     Counter,
@@ -83,6 +85,56 @@ auth_tokens_issued_total = Counter(
 # Middleware
 # -------------------------------------------------------------------
 
+# Paths carrying IDs are reported under their route template so the
+# endpoint label keeps a bounded set of values. Patterns are matched against
+# the path without its surrounding slashes.
+_ENDPOINT_TEMPLATES: Tuple[Tuple[str, str], ...] = (
+    (r"api/tts/status(?:/.*)?", "/api/tts/status/{job_id}"),
+    (r"audio_cache_v2/.+", "/audio_cache_v2/{filename}"),
+)
+# One alternation with a named group per template: a single regex scan
+# replaces a chain of per-route comparisons
+_ENDPOINT_RE = re.compile(
+    "|".join(
+        f"(?P<t{index}>{pattern})"
+        for index, (pattern, _) in enumerate(_ENDPOINT_TEMPLATES)
+    ),
+    re.DOTALL,
+)
+_TEMPLATE_BY_GROUP = {
+    f"t{index}": template for index, (_, template) in enumerate(_ENDPOINT_TEMPLATES)
+}
+
+
+# Request paths repeat heavily, so most lookups are a cache hit; the size
+# bound keeps memory flat when clients probe arbitrary paths
+@lru_cache(maxsize=2048)
+def _endpoint_path(path: str) -> str:
+    """Return the endpoint label for a request path."""
+    match = _ENDPOINT_RE.fullmatch(path.strip("/"))
+    if match is None or match.lastgroup is None:
+        return path
+    return _TEMPLATE_BY_GROUP[match.lastgroup]
+
+
+# Bound ``observe``/``inc`` methods of labelled children, keyed by
+# (metric, *label values): labels() validates and hashes its arguments under
+# a lock on every call, and the cached bound method also skips the attribute
+# lookup on the child
+_RECORDERS: Dict[Tuple[Any, ...], Callable[..., None]] = {}
+
+
+def _recorder(metric: Any, *label_values: str) -> Callable[..., None]:
+    """Return ``observe`` (histograms) or ``inc`` of a labelled child."""
+    key = (metric, *label_values)
+    record = _RECORDERS.get(key)
+    if record is None:
+        child = metric.labels(*label_values)
+        record = _RECORDERS.setdefault(
+            key, child.observe if isinstance(metric, Histogram) else child.inc
+        )
+    return record
+
 
 class MetricsMiddleware(BaseHTTPMiddleware):
     """Middleware to collect HTTP metrics."""
@@ -91,67 +143,39 @@ class MetricsMiddleware(BaseHTTPMiddleware):
         super().__init__(app)
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
-        endpoint = self._get_endpoint_path(request.url.path)
+        start_time = perf_counter()
+        method = request.method
+        endpoint = _endpoint_path(request.url.path)
 
-        # record request size
-        try:
-            request_size = int(request.headers.get("content-length", "0"))
-            http_request_size_bytes.labels(
-                method=request.method, endpoint=endpoint
-            ).observe(request_size)
-        except (ValueError, TypeError):
-            pass
+        # record request size (a missing header counts as 0 bytes); headers
+        # are latin-1, where isdecimal() only accepts ASCII digits
+        request_size = request.headers.get("content-length", "0")
+        if request_size.isdecimal():
+            _recorder(http_request_size_bytes, method, endpoint)(int(request_size))
 
         try:
             response = await call_next(request)
-            duration = time.time() - start_time
+            duration = perf_counter() - start_time
+            status_code = str(response.status_code)
 
-            http_requests_total.labels(
-                method=request.method,
-                endpoint=endpoint,
-                status_code=str(response.status_code),
-            ).inc()
-
-            http_request_duration_seconds.labels(
-                method=request.method, endpoint=endpoint
-            ).observe(duration)
+            _recorder(http_requests_total, method, endpoint, status_code)()
+            _recorder(http_request_duration_seconds, method, endpoint)(duration)
 
             # record response size
-            if response.headers.get("content-length"):
-                try:
-                    resp_size = int(response.headers["content-length"])
-                    http_response_size_bytes.labels(
-                        method=request.method,
-                        endpoint=endpoint,
-                        status_code=str(response.status_code),
-                    ).observe(resp_size)
-                except (ValueError, TypeError):
-                    pass
+            resp_size = response.headers.get("content-length")
+            if resp_size and resp_size.isdecimal():
+                _recorder(http_response_size_bytes, method, endpoint, status_code)(
+                    int(resp_size)
+                )
 
             return response
 
         except Exception:
-            duration = time.time() - start_time
-            http_requests_total.labels(
-                method=request.method, endpoint=endpoint, status_code="500"
-            ).inc()
-            http_request_duration_seconds.labels(
-                method=request.method, endpoint=endpoint
-            ).observe(duration)
+            duration = perf_counter() - start_time
+            _recorder(http_requests_total, method, endpoint, "500")()
+            _recorder(http_request_duration_seconds, method, endpoint)(duration)
             raise
 
-    def _get_endpoint_path(self, path: str) -> str:
-        parts = path.strip("/").split("/")
-        if (
-            len(parts) >= 3
-            and parts[0] == "api"
-            and parts[1] == "tts"
-            and parts[2] == "status"
-        ):
-            return "/api/tts/status/{job_id}"
-        return path
-
 
 async def metrics_endpoint() -> Response:
     """Expose Prometheus metrics."""
@@ -1,172 +1,254 @@
 """FastAPI middleware for request ID generation and structured logging."""
 
+import itertools
+import json
+import logging
+import os
+import secrets
+import threading
 import time
 import uuid
-from typing import Callable
+from typing import Any, Dict, Optional
 
-from fastapi import Request, Response
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from .logging_config import (
     get_logger,
     set_request_id,
     get_request_id,
-    generate_correlation_id,
+    reset_correlation_id,
+    reset_request_id,
     set_correlation_id,
 )
 
+try:  # pragma: no cover - optional faster encoder
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 logger = get_logger(__name__)
 
+# Body of the 500 response up to the request ID; only the ID is encoded per
+# error. Same bytes JSONResponse produced for the equivalent dict.
+_ERROR_BODY_PREFIX = (
+    b'{"status":"error","message":"Internal server error","request_id":'
+)
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    """Middleware to generate and propagate request IDs."""
 
-    def __init__(self, app: Callable, header_name: str = "X-Request-ID"):
-        super().__init__(app)
-        self.header_name = header_name
+def _error_body(request_id: Optional[str]) -> bytes:
+    """JSON body of the 500 response for ``request_id``."""
+    if orjson is not None:
+        encoded = orjson.dumps(request_id)
+    else:
+        encoded = json.dumps(request_id, ensure_ascii=False).encode("utf-8")
+    return _ERROR_BODY_PREFIX + encoded + b"}"
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Process each request with request ID generation."""
-        # Generate or extract request ID
-        request_id = request.headers.get(self.header_name, str(uuid.uuid4()))
 
-        # Set in thread-local storage
-        set_request_id(request_id)
+# Request IDs only need to be unique, not unpredictable. SECURE_REQUEST_IDS=1
+# generates a full uuid4 per request instead of using the ID pool.
+SECURE_REQUEST_IDS = os.environ.get("SECURE_REQUEST_IDS", "").lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
 
-        # Generate correlation ID if not present
-        correlation_id = request.headers.get(
-            "X-Correlation-ID", generate_correlation_id()
-        )
-        set_correlation_id(correlation_id)
-
-        # Add request ID to request state for use in handlers
-        request.state.request_id = request_id
-        request.state.correlation_id = correlation_id
-
-        # Log request start
-        logger.info(
-            f"Request started: {request.method} {request.url.path}",
-            extra={
-                "method": request.method,
-                "path": request.url.path,
-                "query_params": str(request.query_params),
-                "user_agent": request.headers.get("user-agent"),
-                "remote_addr": request.client.host if request.client else None,
-                "request_size": request.headers.get("content-length"),
-            },
-        )
 
-        # Process request
-        start_time = time.time()
-        response = await call_next(request)
-        duration = time.time() - start_time
-
-        # Add request ID and correlation ID to response headers
-        response.headers[self.header_name] = request_id
-        response.headers["X-Correlation-ID"] = correlation_id
-
-        # Log request completion
-        logger.info(
-            f"Request completed: {request.method} {request.url.path}",
-            extra={
-                "status_code": response.status_code,
-                "duration_ms": round(duration * 1000, 2),
-                "response_size": response.headers.get("content-length"),
-            },
-        )
+class _IdPool:
+    """Unique request IDs from a random prefix plus a counter.
 
-        return response
+    IDs keep the UUID v4 layout: the random prefix fills the first 28
+    characters (version and variant bits set) and the counter the last 8
+    hex digits, so generating an ID is a single f-string. The prefix is
+    renewed every ``REFRESH_EVERY`` IDs and after fork.
+    """
 
+    REFRESH_EVERY = 1 << 20
 
-class StructuredLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for structured logging of requests and responses."""
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._refresh()
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Log structured information about requests and responses."""
-        start_time = time.time()
+    def _refresh(self) -> None:
+        h = secrets.token_hex(12)
+        variant = "89ab"[int(h[15], 16) & 3]
+        prefix = f"{h[:8]}-{h[8:12]}-4{h[12:15]}-{variant}{h[16:19]}-{h[19:23]}"
+        # Prefix and counter are swapped in together so a reader never pairs
+        # a new prefix with the old counter
+        self._state = (prefix, itertools.count())
 
-        # Extract request details
-        request_details = {
-            "method": request.method,
-            "path": request.url.path,
-            "query_params": dict(request.query_params),
-            "headers": dict(request.headers),
-            "client_ip": request.client.host if request.client else None,
-            "user_agent": request.headers.get("user-agent"),
-        }
+    def next_id(self) -> str:
+        prefix, counter = self._state
+        n = next(counter)  # atomic under the GIL
+        if n >= self.REFRESH_EVERY:
+            with self._lock:
+                if self._state[0] == prefix:
+                    self._refresh()
+            prefix, counter = self._state
+            n = next(counter)
+        return f"{prefix}{n:08x}"
 
-        try:
-            response = await call_next(request)
-            duration = time.time() - start_time
-
-            # Log successful request
-            logger.info(
-                "HTTP Request",
-                extra={
-                    "http_method": request.method,
-                    "http_path": request.url.path,
-                    "http_status": response.status_code,
-                    "http_duration_ms": round(duration * 1000, 2),
-                    "http_response_size": response.headers.get("content-length"),
-                    "http_request_size": request.headers.get("content-length"),
-                    "user_agent": request.headers.get("user-agent"),
-                    "client_ip": request.client.host if request.client else None,
-                },
-            )
 
-            return response
-
-        except Exception as exc:
-            duration = time.time() - start_time
-
-            # Log error request
-            logger.error(
-                "HTTP Request Error",
-                extra={
-                    "http_method": request.method,
-                    "http_path": request.url.path,
-                    "http_duration_ms": round(duration * 1000, 2),
-                    "error_type": type(exc).__name__,
-                    "error_message": str(exc),
-                    "client_ip": request.client.host if request.client else None,
-                },
-                exc_info=True,
-            )
+_ID_POOL = _IdPool()
+
+if hasattr(os, "register_at_fork"):
+    # Forked workers would otherwise hand out the same IDs
+    os.register_at_fork(after_in_child=_ID_POOL._refresh)
 
-            # Return error response
-            return JSONResponse(
-                status_code=500,
-                content={
-                    "status": "error",
-                    "message": "Internal server error",
-                    "request_id": get_request_id(),
-                },
-            )
 
+# Request header names as they appear in scope["headers"] (lowercase bytes)
+_USER_AGENT = b"user-agent"
+_CONTENT_LENGTH = b"content-length"
+_CORRELATION_ID = b"x-correlation-id"
 
-class ExceptionLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log unhandled exceptions with full context."""
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Catch and log any unhandled exceptions."""
+# Polled endpoints whose requests are not logged. They still get request
+# IDs, and unhandled exceptions on them are still logged.
+_SKIP_PATHS = frozenset({"/health", "/healthz", "/metrics", "/openapi.json"})
+_SKIP_PREFIXES = ("/docs", "/redoc")
+
+
+def _new_id() -> str:
+    if SECURE_REQUEST_IDS:
+        return str(uuid.uuid4())
+    return _ID_POOL.next_id()
+
+
+class ObservabilityMiddleware:
+    """Request IDs, request logging and exception logging in one ASGI layer.
+
+    Written against raw ASGI rather than BaseHTTPMiddleware, which runs the
+    app in a separate task and wraps the response stream on every request.
+    """
+
+    def __init__(self, app: ASGIApp, header_name: str = "X-Request-ID"):
+        self.app = app
+        self.header_name = header_name
+        self._header_key = header_name.lower().encode("latin-1")
+        self._wanted = frozenset(
+            (self._header_key, _CORRELATION_ID, _USER_AGENT, _CONTENT_LENGTH)
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # One pass over the raw headers for the few this layer reads; the
+        # first occurrence wins, as with Headers.get
+        wanted = self._wanted
+        found: Dict[bytes, str] = {}
+        for name, value in scope["headers"]:
+            if name in wanted and name not in found:
+                found[name] = value.decode("latin-1")
+
+        method = scope["method"]
+        path = scope["path"]
+        query = scope.get("query_string", b"").decode("latin-1")
+        client = scope.get("client")
+        client_ip = client[0] if client else None
+        user_agent = found.get(_USER_AGENT)
+        request_size = found.get(_CONTENT_LENGTH)
+
+        # Generate or extract request and correlation IDs
+        request_id = found.get(self._header_key) or _new_id()
+        correlation_id = found.get(_CORRELATION_ID) or _new_id()
+
+        # Handlers read the IDs from request.state
+        state = scope.setdefault("state", {})
+        state["request_id"] = request_id
+        state["correlation_id"] = correlation_id
+
+        # Bind both IDs to this request's context; they are restored when it
+        # finishes so nothing leaks into the next request on this task
+        request_token = set_request_id(request_id)
+        correlation_token = set_correlation_id(correlation_id)
         try:
-            return await call_next(request)
-        except Exception as exc:
-            # Log the exception with full context
-            logger.error(
-                "Unhandled exception in request",
-                extra={
-                    "http_method": request.method,
-                    "http_path": request.url.path,
-                    "http_query": str(request.query_params),
-                    "client_ip": request.client.host if request.client else None,
-                    "user_agent": request.headers.get("user-agent"),
-                    "exception_type": type(exc).__name__,
-                    "exception_message": str(exc),
-                },
-                exc_info=True,
+            # Level checks are cached by logging; skip building the extras
+            # when INFO is off or the path is a polled one
+            info_enabled = logger.isEnabledFor(logging.INFO) and not (
+                path in _SKIP_PATHS or path.startswith(_SKIP_PREFIXES)
             )
-
-            # Re-raise to let FastAPI's exception handlers deal with it
-            raise
+            if info_enabled:
+                logger.info(
+                    f"Request started: {method} {path}",
+                    extra={
+                        "method": method,
+                        "path": path,
+                        "query_params": query,
+                        "user_agent": user_agent,
+                        "remote_addr": client_ip,
+                        "request_size": request_size,
+                    },
+                )
+
+            response_start: Dict[str, Any] = {}
+            id_headers = [
+                (self._header_key, request_id.encode("latin-1")),
+                (_CORRELATION_ID, correlation_id.encode("latin-1")),
+            ]
+
+            async def send_with_ids(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    # The IDs are new headers, so they are appended to the raw
+                    # list without a lookup
+                    message["headers"] = [*message.get("headers", ()), *id_headers]
+                    response_start.update(message)
+                await send(message)
+
+            start_ns = time.perf_counter_ns()
+            try:
+                await self.app(scope, receive, send_with_ids)
+            except Exception as exc:
+                duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+                logger.error(
+                    "Unhandled exception in request",
+                    extra={
+                        "http_method": method,
+                        "http_path": path,
+                        "http_query": query,
+                        "http_duration_ms": duration_ms,
+                        "client_ip": client_ip,
+                        "user_agent": user_agent,
+                        "exception_type": type(exc).__name__,
+                        "exception_message": str(exc),
+                    },
+                    exc_info=True,
+                )
+                if response_start:
+                    # Too late to replace the response; let the server close it
+                    raise
+                error_response = Response(
+                    content=_error_body(get_request_id()),
+                    status_code=500,
+                    media_type="application/json",
+                )
+                await error_response(scope, receive, send_with_ids)
+            else:
+                duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+
+            if info_enabled:
+                logger.info(
+                    f"Request completed: {method} {path}",
+                    extra={
+                        "http_method": method,
+                        "http_path": path,
+                        "http_status": response_start.get("status"),
+                        "http_duration_ms": duration_ms,
+                        "http_response_size": _content_length(response_start),
+                        "http_request_size": request_size,
+                        "user_agent": user_agent,
+                        "client_ip": client_ip,
+                    },
+                )
+        finally:
+            reset_correlation_id(correlation_token)
+            reset_request_id(request_token)
+
+
+def _content_length(response_start: Dict[str, Any]) -> Optional[str]:
+    for name, value in response_start.get("headers", ()):
+        if name.lower() == _CONTENT_LENGTH:
+            return value.decode("latin-1")
+    return None
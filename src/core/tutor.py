@@ -3,22 +3,36 @@
 import logging
 import os
 import re
-from datetime import datetime
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple, Union, Set
 
 import Levenshtein
-from openai import OpenAI
 
 from src.core.lesson_manager import LessonManager
 from src.models import Attempt, Lesson
+from src.services.attempt_writer import AttemptWriter
 from src.services.database_service import Database
 from src.services.feedback_engine import FeedbackEngine
 from src.services.lesson_generator import LessonGenerator
+from src.services.openai_client import get_openai_client
 from src.services.srs_manager import SRSManager
 from src.services.speech_engine import SpeechEngine
 
 logger = logging.getLogger(__name__)
 
+# Naive UTC epoch; attempt timestamps are stored as naive UTC datetimes
+_EPOCH = datetime(1970, 1, 1)
+
+# BATCH_ATTEMPT_WRITES=1 inserts attempts in batches on a background thread.
+# Responses then carry no attempt_id, since the row is not written yet.
+BATCH_ATTEMPT_WRITES = os.environ.get("BATCH_ATTEMPT_WRITES", "").lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+
 
 class Tutor:
     """Main tutor class orchestrating conversation flow."""
@@ -40,18 +54,31 @@ class Tutor:
         )
         self.database = database or Database()
         self.lesson_generator = LessonGenerator()
+        self._attempt_writer: Optional[AttemptWriter] = (
+            AttemptWriter(self.database) if BATCH_ATTEMPT_WRITES else None
+        )
 
         api_key = os.getenv("OPENAI_API_KEY")
         if api_key and api_key.strip():
-            self._openai_client = OpenAI(api_key=api_key)
+            self._openai_client = get_openai_client(api_key)
             logger.info("✅ Tutor initialized with OpenAI for intent detection")
         else:
             self._openai_client = None
             logger.warning("OpenAI API key not found - AI features limited")
 
-        self._consecutive_lows: Dict[Tuple[int, str], int] = {}
+        # Low-score streaks by dialogue ID, then user ID; inner maps are
+        # removed once empty so finished dialogues do not accumulate
+        self._consecutive_lows: Dict[str, Dict[int, int]] = {}
         self._conversation_mode: Dict[int, bool] = {}
         self._lesson_catalog: List[Dict[str, Any]] = []
+        # Normalized option "match" strings. Keys come from lesson files, so
+        # the memo stays bounded; the served lesson dicts are left untouched.
+        self._normalized_matches: Dict[str, str] = {}
+        # Sequential next-dialogue map per lesson ID, kept with the dialogue
+        # list it was built from so a reloaded lesson gets a fresh map
+        self._next_ids: Dict[
+            Optional[str], Tuple[List[Dict[str, Any]], Dict[str, Optional[str]]]
+        ] = {}
 
     # ------------------------------------------------------------------
     # MAIN RESPONSE PIPELINE
@@ -106,7 +133,8 @@ class Tutor:
             }
 
         expected_phrases = dialogue.get("expected", [])
-        consecutive_lows = self._consecutive_lows.get((user_id, dialogue_id), 0)
+        dialogue_lows = self._consecutive_lows.get(dialogue_id)
+        consecutive_lows = dialogue_lows.get(user_id, 0) if dialogue_lows else 0
         is_confused = self._detect_confusion(
             user_id, text, expected_phrases, consecutive_lows
         )
@@ -130,9 +158,12 @@ class Tutor:
         feedback_type = str(feedback.get("feedback_type", "low"))
 
         if feedback_type == "low":
-            self._consecutive_lows[(user_id, dialogue_id)] = consecutive_lows + 1
-        else:
-            self._consecutive_lows.pop((user_id, dialogue_id), None)
+            if dialogue_lows is None:
+                dialogue_lows = self._consecutive_lows[dialogue_id] = {}
+            dialogue_lows[user_id] = consecutive_lows + 1
+        elif dialogue_lows and dialogue_lows.pop(user_id, None) is not None:
+            if not dialogue_lows:
+                del self._consecutive_lows[dialogue_id]
 
         next_dialogue_id = self._determine_next_dialogue(
             text, dialogue, lesson_data, score
@@ -140,7 +171,12 @@ class Tutor:
         audio_paths = self._get_audio_paths(
             dialogue, lesson_id, dialogue_id, next_dialogue_id, speed
         )
-        attempt_id = self._log_attempt(user_id, dialogue_id, text, score, feedback_type)
+        # One clock read per turn, shared by the attempt row and the response
+        timestamp_ns = time.time_ns()
+        created_at = _EPOCH + timedelta(microseconds=timestamp_ns // 1000)
+        attempt_id = self._log_attempt(
+            user_id, dialogue_id, text, score, feedback_type, created_at
+        )
 
         quality = self._score_to_quality(score, feedback_type)
         try:
@@ -152,7 +188,7 @@ class Tutor:
                 database=self.database,
             )
         except Exception as e:
-            logger.warning(f"Failed to update SRS: {e}")
+            logger.warning("Failed to update SRS: %s", e)
 
         return {
             "status": "success",
@@ -171,7 +207,8 @@ class Tutor:
             },
             "metadata": {
                 "attempt_id": attempt_id,
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": created_at.isoformat() + "Z",
+                "timestamp_ms": timestamp_ns // 1_000_000,
             },
         }
 
@@ -189,30 +226,60 @@ class Tutor:
         """Determine next dialogue using branching logic."""
         options = dialogue.get("options", [])
         if not options:
-            dialogues = lesson_data.get("dialogues", [])
-            for idx, d in enumerate(dialogues):
-                if d.get("id") == dialogue.get("id") and idx + 1 < len(dialogues):
-                    return dialogues[idx + 1].get("id")
-            return None
+            return self._next_dialogue_ids(lesson_data).get(dialogue["id"])
 
         normalized_input = self.feedback_engine.normalize_text(user_text)
-        for opt in options:
-            match = opt.get("match", "")
-            if match and normalized_input == self.feedback_engine.normalize_text(match):
+        matches = [
+            (self._normalize_match(opt["match"]), opt)
+            for opt in options
+            if opt.get("match")
+        ]
+        for norm, opt in matches:
+            if normalized_input == norm:
                 return opt.get("next")
 
-        for opt in options:
-            match = opt.get("match", "")
-            if match:
-                norm = self.feedback_engine.normalize_text(match)
-                if Levenshtein.distance(normalized_input, norm) <= 2:
-                    return opt.get("next")
+        # The distance is at least the length difference, so most options
+        # are ruled out without running the comparison; score_cutoff lets
+        # the remaining comparisons stop once they exceed 2 edits
+        input_len = len(normalized_input)
+        for norm, opt in matches:
+            if abs(input_len - len(norm)) > 2:
+                continue
+            if Levenshtein.distance(normalized_input, norm, score_cutoff=2) <= 2:
+                return opt.get("next")
 
         for opt in options:
             if opt.get("default", False):
                 return opt.get("next")
         return None
 
+    def _next_dialogue_ids(
+        self, lesson_data: Dict[str, Any]
+    ) -> Dict[str, Optional[str]]:
+        """Map each dialogue ID of a lesson to the ID of the dialogue after it."""
+        dialogues = lesson_data.get("dialogues", [])
+        lesson_id = lesson_data.get("id")
+        cached = self._next_ids.get(lesson_id)
+        if cached is not None and cached[0] is dialogues:
+            return cached[1]
+        next_ids: Dict[str, Optional[str]] = {}
+        for idx, d in enumerate(dialogues):
+            # First occurrence wins for duplicated IDs, as the scan did
+            if idx + 1 < len(dialogues):
+                next_ids.setdefault(d.get("id"), dialogues[idx + 1].get("id"))
+            else:
+                next_ids.setdefault(d.get("id"), None)
+        self._next_ids[lesson_id] = (dialogues, next_ids)
+        return next_ids
+
+    def _normalize_match(self, match: str) -> str:
+        """Return the normalized form of an option match, computed once."""
+        norm = self._normalized_matches.get(match)
+        if norm is None:
+            norm = self.feedback_engine.normalize_text(match)
+            self._normalized_matches[match] = norm
+        return norm
+
     def _log_attempt(
         self,
         user_id: int,
@@ -220,21 +287,27 @@ class Tutor:
         user_text: str,
         score: float,
         feedback_type: str,
+        created_at: Optional[datetime] = None,
     ) -> Optional[int]:
-        """Log attempt to database."""
+        """Log attempt to database (``created_at`` is naive UTC)."""
+        if created_at is None:
+            created_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        row = {
+            "user_id": user_id,
+            "phrase_id": phrase_id,
+            "user_input": user_text,
+            "score": score,
+            "feedback_type": feedback_type,
+            "created_at": created_at,
+        }
+        if self._attempt_writer is not None:
+            self._attempt_writer.submit(row)
+            return None
         try:
-            attempt = self.database.create(
-                Attempt,
-                user_id=user_id,
-                phrase_id=phrase_id,
-                user_input=user_text,
-                score=score,
-                feedback_type=feedback_type,
-                created_at=datetime.utcnow(),
-            )
+            attempt = self.database.create(Attempt, **row)
             return getattr(attempt, "id", None)
         except Exception as e:
-            logger.error(f"Failed to log attempt: {e}")
+            logger.error("Failed to log attempt: %s", e)
             return None
 
     def _score_to_quality(self, score: float, feedback_type: str) -> int:
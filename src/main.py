@@ -25,12 +25,9 @@ load_dotenv(dotenv_path=env_path)
 # -----------------------------
 from src.core.app_context import app_context
 from src.core.logging_config import setup_structured_logging
-from src.core.middleware import (
-    RequestIDMiddleware,
-    StructuredLoggingMiddleware,
-    ExceptionLoggingMiddleware,
-)
+from src.core.middleware import ObservabilityMiddleware
 from src.core.metrics import MetricsMiddleware, metrics_endpoint
+from src.api.routers.websocket import websocket_chat
 
 logger = logging.getLogger(__name__)
 BASE_DIR = Path(__file__).resolve().parents[1]
@@ -72,9 +69,7 @@ app.add_middleware(
 # Middleware Stack
 # -----------------------------
 app.add_middleware(MetricsMiddleware)
-app.add_middleware(ExceptionLoggingMiddleware)
-app.add_middleware(StructuredLoggingMiddleware)
-app.add_middleware(RequestIDMiddleware)
+app.add_middleware(ObservabilityMiddleware)
 
 # -----------------------------
 # Static Directories
@@ -147,8 +142,6 @@ app.include_router(api_v2_router)
 # -----------------------------
 @app.websocket("/ws/chat")
 async def websocket_endpoint(websocket: WebSocket):
-    from src.api.routers.websocket import websocket_chat
-
     await websocket_chat(websocket)
 
 
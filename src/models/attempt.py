@@ -35,4 +35,5 @@ class Attempt(Base):
         Index("idx_attempts_user", "user_id"),
         Index("idx_attempts_phrase", "phrase_id"),
         Index("idx_attempts_created", "created_at"),
+        Index("idx_attempts_user_created", "user_id", "created_at"),
     )
@@ -47,5 +47,6 @@ class SRSMemory(Base):
         UniqueConstraint("user_id", "phrase_id", name="uq_user_phrase"),
         Index("idx_srs_user", "user_id"),
         Index("idx_srs_next_review", "next_review"),
+        Index("idx_srs_user_next_review", "user_id", "next_review"),
         Index("idx_srs_phrase", "phrase_id"),
     )
@@ -0,0 +1,110 @@
+"""Background writer batching Attempt inserts."""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set
+
+from src.services.user_stats_cache import invalidate_user_stats_cache
+
+logger = logging.getLogger(__name__)
+
+# Running writers, stopped at exit so queued attempts are not lost
+_writers: Set["AttemptWriter"] = set()
+
+
+def _stop_writers() -> None:
+    for writer in list(_writers):
+        writer.stop()
+
+
+atexit.register(_stop_writers)
+
+
+class AttemptWriter:
+    """Collects attempt rows and inserts them in batches on a worker thread.
+
+    ``submit`` only enqueues, so a tutor turn does not wait for the
+    database. The worker writes up to ``batch_size`` rows per statement,
+    or whatever arrived within ``max_delay`` seconds of the first row.
+    When the queue is full the row is written synchronously instead of
+    being dropped. Pending rows are written on ``stop`` and at exit.
+    """
+
+    def __init__(
+        self,
+        database: Any,
+        batch_size: int = 256,
+        max_delay: float = 0.05,
+        maxsize: int = 1000,
+    ) -> None:
+        self.database = database
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize)
+        self._thread = threading.Thread(
+            target=self._run, name="attempt-writer", daemon=True
+        )
+        self._thread.start()
+        _writers.add(self)
+
+    def submit(self, row: Dict[str, Any]) -> None:
+        """Queue one attempt row (``Attempt`` column names)."""
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self._write([row])
+
+    def flush(self) -> None:
+        """Block until every queued row has been written."""
+        self._queue.join()
+
+    def stop(self) -> None:
+        """Write pending rows and stop the worker thread."""
+        if not self._thread.is_alive():
+            return
+        self._queue.put(None)
+        self._thread.join()
+        _writers.discard(self)
+
+    def _run(self) -> None:
+        while True:
+            row = self._queue.get()
+            if row is None:
+                self._queue.task_done()
+                return
+            rows = [row]
+            stop = False
+            deadline = time.monotonic() + self.max_delay
+            while len(rows) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    row = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if row is None:
+                    stop = True
+                    break
+                rows.append(row)
+            try:
+                self._write(rows)
+            finally:
+                for _ in range(len(rows) + stop):
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _write(self, rows: List[Dict[str, Any]]) -> None:
+        try:
+            self.database.create_attempts_bulk(rows)
+        except Exception as e:
+            logger.error("Failed to log %d attempts: %s", len(rows), e)
+            return
+        # Stats cached before these rows landed are stale now
+        for user_id in {row.get("user_id") for row in rows}:
+            if user_id is not None:
+                invalidate_user_stats_cache(user_id)
@@ -1,8 +1,10 @@
 """Database service layer with CRUD operations."""
 
 from contextlib import contextmanager
-from typing import Any, Dict, List, Optional, Type, TypeVar
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
 
+from sqlalchemy import and_, case, func, insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -162,6 +164,35 @@ class Database:
             Phrase, id=phrase_id, lesson_id=lesson_id, text=text, **kwargs
         )
 
+    def create_phrases_bulk(self, rows: List[Dict[str, Any]]) -> int:
+        """Insert phrase rows (``Phrase`` column names) in one statement."""
+        if not rows:
+            return 0
+        with self.get_session() as session:
+            self._insert_phrases(session, rows)
+        return len(rows)
+
+    def create_lesson_with_phrases(
+        self,
+        lesson_id: str,
+        title: str,
+        level: str,
+        phrase_rows: List[Dict[str, Any]],
+        **kwargs: Any,
+    ) -> Lesson:
+        """Create a lesson and its phrases in a single transaction."""
+        with self.get_session() as session:
+            lesson = Lesson(id=lesson_id, title=title, level=level, **kwargs)
+            session.add(lesson)
+            session.flush()
+            if phrase_rows:
+                self._insert_phrases(session, phrase_rows)
+            session.refresh(lesson)
+            return self._expunge_instance(session, lesson)
+
+    def _insert_phrases(self, session: Session, rows: List[Dict[str, Any]]) -> None:
+        session.execute(insert(Phrase), rows)
+
     def get_phrase(self, phrase_id: str) -> Optional[Phrase]:
         return self.get_by_id(Phrase, phrase_id)
 
@@ -213,6 +244,24 @@ class Database:
                 .all()
             )
 
+    def get_user_progress_counts(self, user_id: int) -> Tuple[int, int]:
+        """Return (completed, total) lesson progress rows for a user."""
+        with self.get_session() as session:
+            completed, total = (
+                session.query(
+                    func.coalesce(
+                        func.sum(
+                            case((LessonProgress.status == "completed", 1), else_=0)
+                        ),
+                        0,
+                    ),
+                    func.count(LessonProgress.id),
+                )
+                .filter(LessonProgress.user_id == user_id)
+                .one()
+            )
+            return int(completed), int(total)
+
     def update_lesson_progress(
         self, progress_id: int, **kwargs: Any
     ) -> Optional[LessonProgress]:
@@ -243,6 +292,14 @@ class Database:
             **kwargs,
         )
 
+    def create_attempts_bulk(self, rows: List[Dict[str, Any]]) -> int:
+        """Insert attempt rows (``Attempt`` column names) in one statement."""
+        if not rows:
+            return 0
+        with self.get_session() as session:
+            session.execute(insert(Attempt), rows)
+        return len(rows)
+
     def get_attempt(self, attempt_id: int) -> Optional[Attempt]:
         return self.get_by_id(Attempt, attempt_id)
 
@@ -262,6 +319,19 @@ class Database:
                 session.expunge(a)
             return attempts
 
+    def get_user_attempt_summary(self, user_id: int) -> Tuple[int, float]:
+        """Return (attempt count, sum of scores) for a user, aggregated in SQL."""
+        with self.get_session() as session:
+            count, total_score = (
+                session.query(
+                    func.count(Attempt.id),
+                    func.coalesce(func.sum(Attempt.score), 0.0),
+                )
+                .filter(Attempt.user_id == user_id)
+                .one()
+            )
+            return int(count), float(total_score)
+
     def get_phrase_attempts(
         self, phrase_id: str, limit: Optional[int] = None
     ) -> List[Attempt]:
@@ -337,15 +407,37 @@ class Database:
             session.refresh(new_meta)
             return new_meta
 
-    def get_due_srs_items(self, user_id: int) -> List[Dict[str, Any]]:
-        """Return SRS items due for review."""
-        from datetime import datetime
-        from sqlalchemy import and_
-
+    def count_due_srs_items(self, user_id: int) -> int:
+        """Return how many SRS items are due for review for a user."""
+        now = datetime.utcnow()
+        with self.get_session() as session:
+            count = (
+                session.query(func.count(SRSMemory.id))
+                .filter(
+                    and_(
+                        SRSMemory.user_id == user_id,
+                        SRSMemory.next_review <= now,
+                    )
+                )
+                .scalar()
+            )
+            return int(count or 0)
+
+    def get_due_srs_items(
+        self, user_id: int, limit: Optional[int] = None, offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Return SRS items due for review, oldest first.
+
+        The owning phrase is joined in the same query, so each item also
+        carries its ``lesson_id`` and ``phrase_text`` (``None`` when the
+        phrase row is missing). ``limit``/``offset`` page through the due
+        items using the ``(user_id, next_review)`` index.
+        """
         now = datetime.utcnow()
         with self.get_session() as session:
-            items = (
-                session.query(SRSMemory)
+            query = (
+                session.query(SRSMemory, Phrase.lesson_id, Phrase.text)
+                .outerjoin(Phrase, Phrase.id == SRSMemory.phrase_id)
                 .filter(
                     and_(
                         SRSMemory.user_id == user_id,
@@ -353,8 +445,10 @@ class Database:
                     )
                 )
                 .order_by(SRSMemory.next_review.asc())
-                .all()
             )
+            if limit:
+                query = query.limit(limit).offset(offset)
+            rows = query.all()
             return [
                 {
                     "id": i.id,
@@ -367,8 +461,10 @@ class Database:
                     "interval_days": i.interval_days,
                     "review_count": i.review_count,
                     "strength_level": i.strength_level,
+                    "lesson_id": lesson_id,
+                    "phrase_text": phrase_text,
                 }
-                for i in items
+                for i, lesson_id, phrase_text in rows
             ]
 
     def get_user_srs_memories(self, user_id: int) -> List[Dict[str, Any]]:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import json
 import logging
 import os
@@ -12,6 +13,8 @@ from typing import Any, Dict, Optional
 
 from openai import OpenAI
 
+from src.services.openai_client import get_openai_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -70,7 +73,7 @@ class EvaluationService:
             return None
 
         try:
-            return OpenAI(api_key=api_key)
+            return get_openai_client(api_key)
         except Exception as exc:
             logger.error("Failed to create OpenAI client: %s", exc)
             return None
@@ -216,8 +219,6 @@ class EvaluationService:
         try:
             loop = asyncio.get_event_loop()
             if loop.is_running():
-                import concurrent.futures
-
                 with concurrent.futures.ThreadPoolExecutor() as ex:
                     fut = ex.submit(
                         asyncio.run, self.llm_score(target_phrase, user_transcript)
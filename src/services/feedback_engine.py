@@ -1,5 +1,6 @@
 """Feedback Engine for evaluating user input and generating responses."""
 
+import difflib
 import logging
 import os
 import re
@@ -12,6 +13,8 @@ from openai import OpenAI
 from phonemizer import phonemize
 from phonemizer.backend import EspeakBackend
 
+from src.services.openai_client import get_openai_client
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------
@@ -65,7 +68,7 @@ class FeedbackEngine:
         try:
             api_key = os.getenv("OPENAI_API_KEY")
             if api_key and api_key.strip():
-                self._openai_client = OpenAI(api_key=api_key)
+                self._openai_client = get_openai_client(api_key)
                 logger.info("✅ OpenAI client initialized for AI evaluation")
             else:
                 logger.warning("OpenAI API key not found — using basic matching only")
@@ -379,8 +382,6 @@ Respond in JSON:
         if not expected_phrases:
             return 0.0, ""
 
-        import difflib
-
         best_phrase = max(
             expected_phrases,
             key=lambda phrase: difflib.SequenceMatcher(
@@ -8,6 +8,8 @@ from typing import Any, Dict, List, Optional
 
 from openai import OpenAI
 
+from src.services.openai_client import get_openai_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,7 +23,7 @@ class LessonGenerator:
         try:
             api_key = os.getenv("OPENAI_API_KEY")
             if api_key and api_key.strip():
-                self._openai_client = OpenAI(api_key=api_key)
+                self._openai_client = get_openai_client(api_key)
                 logger.info("✅ LessonGenerator initialized with AI")
             else:
                 logger.warning("OpenAI API key not found — dynamic lessons unavailable")
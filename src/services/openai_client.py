@@ -0,0 +1,25 @@
+"""Shared OpenAI client with a reusable HTTP connection pool."""
+
+from functools import lru_cache
+
+import httpx
+from openai import OpenAI
+
+# Keep the SDK's default 600s read timeout for slow generations; only
+# connects fail fast
+_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+_LIMITS = httpx.Limits(max_keepalive_connections=100, max_connections=200)
+
+
+@lru_cache(maxsize=4)
+def get_openai_client(api_key: str) -> OpenAI:
+    """Return the process-wide OpenAI client for ``api_key``.
+
+    Services share one client, and with it one keep-alive connection pool,
+    instead of opening a new pool (and TLS handshakes) per instance.
+    """
+    return OpenAI(
+        api_key=api_key,
+        timeout=_TIMEOUT,
+        http_client=httpx.Client(limits=_LIMITS, timeout=_TIMEOUT),
+    )
@@ -7,7 +7,7 @@ import logging
 import os
 import time
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, FrozenSet, Optional, Set, Tuple
 
 import httpx
 
@@ -16,6 +16,39 @@ DEFAULT_MURF_STYLE = os.getenv("MURF_VOICE_STYLE") or "Conversational"
 
 logger = logging.getLogger(__name__)
 
+# Seconds the bundled audio index is trusted before the tree is rescanned
+NATIVE_AUDIO_INDEX_TTL = 300.0
+
+
+def _scan_audio_tree(root: Path) -> FrozenSet[str]:
+    """Return ``/``-joined relative paths of every ``.mp3`` under ``root``.
+
+    Uses ``os.scandir`` so each directory costs one listing and file types
+    come from the directory entries rather than a ``stat()`` per file.
+    Symlinked directories are followed; each directory is listed once, so
+    link cycles terminate.
+    """
+    found = set()
+    visited: Set[Tuple[int, int]] = set()
+    stack = [("", str(root))]
+    while stack:
+        prefix, directory = stack.pop()
+        try:
+            st = os.stat(directory)
+            if (st.st_dev, st.st_ino) in visited:
+                continue
+            visited.add((st.st_dev, st.st_ino))
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir():
+                    stack.append((f"{prefix}{entry.name}/", entry.path))
+                elif entry.name.endswith(".mp3") and entry.is_file():
+                    found.add(prefix + entry.name)
+    return frozenset(found)
+
 
 class SpeechEngine:
     """Generate or retrieve speech audio using Murf.ai."""
@@ -47,6 +80,9 @@ class SpeechEngine:
         self.timeout = timeout
         self.poll_interval = poll_interval
         self.max_wait_seconds = max_wait_seconds
+        # "lesson_id/filename.mp3" keys of bundled audio, built on first lookup
+        self._native_audio_index: Optional[FrozenSet[str]] = None
+        self._native_audio_indexed_at = 0.0
 
     # ------------------------------------------------------------------
     # Public API
@@ -127,6 +163,10 @@ class SpeechEngine:
                 continue
         return removed
 
+    def refresh_native_audio_index(self) -> None:
+        """Drop the bundled audio index so the next lookup rescans it."""
+        self._native_audio_index = None
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -142,23 +182,37 @@ class SpeechEngine:
         if not lesson_id or not (phrase_id or audio_filename):
             return None
 
-        base_dir = self.native_audio_dir / lesson_id
-        if not base_dir.exists():
-            return None
-
+        native_index = self.native_audio_index
         base_name = audio_filename or phrase_id
         speed_suffix = "_slow" if speed < 1.0 else "_fast" if speed > 1.0 else ""
         candidates = []
 
         if speed_suffix:
-            candidates.append(base_dir / f"{base_name}{speed_suffix}.mp3")
-        candidates.append(base_dir / f"{base_name}.mp3")
+            candidates.append(f"{lesson_id}/{base_name}{speed_suffix}.mp3")
+        candidates.append(f"{lesson_id}/{base_name}.mp3")
 
         for candidate in candidates:
-            if candidate.exists():
-                return candidate
+            if candidate in native_index:
+                return self.native_audio_dir / candidate
         return None
 
+    @property
+    def native_audio_index(self) -> FrozenSet[str]:
+        """Relative paths of all bundled audio files.
+
+        Membership in this set replaces a ``stat()`` per candidate file on
+        every lookup. The tree is rescanned after ``NATIVE_AUDIO_INDEX_TTL``
+        seconds so audio added while the app runs is eventually served.
+        """
+        now = time.monotonic()
+        if (
+            self._native_audio_index is None
+            or now - self._native_audio_indexed_at >= NATIVE_AUDIO_INDEX_TTL
+        ):
+            self._native_audio_index = _scan_audio_tree(self.native_audio_dir)
+            self._native_audio_indexed_at = now
+        return self._native_audio_index
+
     def _cache_file_path(self, cache_key: str) -> Path:
         """Return a nested path for the given cache key."""
         subdir = self.cache_dir / cache_key[:2]
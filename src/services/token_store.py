@@ -0,0 +1,81 @@
+"""Refresh token storage backends."""
+
+import threading
+import time
+from typing import Dict, Optional, Protocol, Tuple
+
+
+class TokenStore(Protocol):
+    """Storage for the current refresh token of each user."""
+
+    def set(self, user_id: int, token: str, ttl_seconds: int) -> None: ...
+
+    def get(self, user_id: int) -> Optional[str]: ...
+
+    def revoke(self, user_id: int) -> None: ...
+
+
+class InMemoryTokenStore:
+    """Process-local token store guarded by a lock.
+
+    Suitable for development and single-worker deployments; tokens are not
+    shared between worker processes.
+    """
+
+    def __init__(self) -> None:
+        self._tokens: Dict[int, Tuple[str, float]] = {}
+        self._lock = threading.RLock()
+
+    def set(self, user_id: int, token: str, ttl_seconds: int) -> None:
+        with self._lock:
+            self._tokens[user_id] = (token, time.monotonic() + ttl_seconds)
+
+    def get(self, user_id: int) -> Optional[str]:
+        with self._lock:
+            entry = self._tokens.get(user_id)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                del self._tokens[user_id]
+                return None
+            return entry[0]
+
+    def revoke(self, user_id: int) -> None:
+        with self._lock:
+            self._tokens.pop(user_id, None)
+
+
+class RedisTokenStore:
+    """Token store shared by all workers through Redis.
+
+    Requires the optional ``redis`` package.
+    """
+
+    KEY_PREFIX = "refresh:"
+
+    def __init__(self, url: str) -> None:
+        try:
+            import redis
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "TOKEN_STORE_BACKEND=redis requires the 'redis' package"
+            ) from exc
+        self._client = redis.Redis.from_url(url, decode_responses=True)
+
+    def set(self, user_id: int, token: str, ttl_seconds: int) -> None:
+        self._client.setex(f"{self.KEY_PREFIX}{user_id}", ttl_seconds, token)
+
+    def get(self, user_id: int) -> Optional[str]:
+        return self._client.get(f"{self.KEY_PREFIX}{user_id}")
+
+    def revoke(self, user_id: int) -> None:
+        self._client.delete(f"{self.KEY_PREFIX}{user_id}")
+
+
+def create_token_store(backend: str, redis_url: Optional[str] = None) -> TokenStore:
+    """Create the token store selected by ``TOKEN_STORE_BACKEND``."""
+    if backend == "memory":
+        return InMemoryTokenStore()
+    if backend == "redis":
+        return RedisTokenStore(redis_url or "redis://localhost:6379/0")
+    raise ValueError(f"Unknown token store backend: {backend}")
@@ -0,0 +1,63 @@
+"""Short-lived per-user cache for the /api/user/stats payload."""
+
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+# Seconds a computed stats payload is served before it is rebuilt
+STATS_CACHE_TTL = 30.0
+
+
+class UserStatsCache:
+    """Stats payloads by user ID, dropped when new attempts land.
+
+    Every invalidation bumps a generation counter. A payload is only
+    stored if no invalidation happened while it was being built, so a
+    build that read the database before a write cannot cache stale stats.
+    """
+
+    def __init__(self, ttl: float = STATS_CACHE_TTL) -> None:
+        self.ttl = ttl
+        self._entries: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+        self._generations: Dict[int, int] = {}
+        # Bumped when every user is invalidated at once
+        self._epoch = 0
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """Return the cached payload for ``user_id`` if it is still fresh."""
+        cached = self._entries.get(user_id)
+        if cached is not None and time.monotonic() - cached[0] < self.ttl:
+            return cached[1]
+        return None
+
+    def generation(self, user_id: int) -> Tuple[int, int]:
+        """Token to take before building a payload and pass to ``store``."""
+        return self._epoch, self._generations.get(user_id, 0)
+
+    def store(
+        self, user_id: int, generation: Tuple[int, int], payload: Dict[str, Any]
+    ) -> None:
+        """Cache ``payload`` unless ``user_id`` was invalidated since ``generation``."""
+        with self._lock:
+            if generation == self.generation(user_id):
+                self._entries[user_id] = (time.monotonic(), payload)
+
+    def invalidate(self, user_id: Optional[int] = None) -> None:
+        """Drop cached stats for one user, or for everyone if no ID is given."""
+        with self._lock:
+            if user_id is None:
+                self._epoch += 1
+                self._entries.clear()
+                self._generations.clear()
+            else:
+                self._generations[user_id] = self._generations.get(user_id, 0) + 1
+                self._entries.pop(user_id, None)
+
+
+user_stats_cache = UserStatsCache()
+
+
+def invalidate_user_stats_cache(user_id: Optional[int] = None) -> None:
+    """Drop cached statistics for one user, or for everyone if no ID is given."""
+    user_stats_cache.invalidate(user_id)
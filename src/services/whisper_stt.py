@@ -13,6 +13,7 @@ from typing import Any, Dict, Iterable
 from openai import OpenAI
 
 from src.schemas.v2.speech import SpeechRecognitionResponse, WordTiming
+from src.services.openai_client import get_openai_client
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +33,7 @@ class WhisperSTTService:
             )
             self.client = None
         else:
-            self.client = OpenAI(api_key=api_key)
+            self.client = get_openai_client(api_key)
 
         logger.info(f"[STT] Engine set to: {self.engine}")
 
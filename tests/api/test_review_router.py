@@ -32,12 +32,18 @@ class StubDatabase:
         self.phrases = phrases or {}
         self.raise_on_due = raise_on_due
         self.calls = []
+        self.page_requests = []
 
-    def get_due_srs_items(self, user_id):
+    def get_due_srs_items(self, user_id, limit=None, offset=0):
         if self.raise_on_due:
             raise RuntimeError("database failure")
         self.calls.append(("get_due_srs_items", user_id))
-        return list(self.due_items)
+        self.page_requests.append((limit, offset))
+        items = list(self.due_items)
+        return items[offset : offset + limit] if limit else items
+
+    def count_due_srs_items(self, user_id):
+        return len(self.due_items)
 
     def get_phrase(self, phrase_id):
         self.calls.append(("get_phrase", phrase_id))
@@ -168,3 +174,73 @@ def test_review_update_computes_next_review_when_missing(client, stub_context):
     data = response.json()["data"]
     assert data["interval_days"] == 2
     assert "next_review" in data
+
+
+def test_review_get_uses_joined_phrase_details(client, stub_context):
+    database = stub_context["database"]
+    database.due_items = [
+        {
+            "phrase_id": "L1_turn1",
+            "user_id": 7,
+            "next_review": "2025-01-01T00:00:00Z",
+            "lesson_id": "L1",
+            "phrase_text": "Cześć",
+        }
+    ]
+
+    response = client.get("/api/review/due", params={"user_id": 7})
+
+    assert response.status_code == 200
+    item = response.json()["data"][0]
+    assert item["lesson_id"] == "L1"
+    assert item["phrase_text"] == "Dzień dobry"
+    assert not any(name == "get_phrase" for name, _ in database.calls)
+
+
+def test_review_get_paginates_due_items(client, stub_context):
+    database = stub_context["database"]
+    database.due_items = [
+        StubDueItem(f"L1_turn{i}", user_id=7, next_review=datetime(2025, 1, i))
+        for i in range(1, 6)
+    ]
+
+    response = client.get(
+        "/api/review/due", params={"user_id": 7, "limit": 2, "offset": 1}
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["phrase_id"] for item in body["data"]] == ["L1_turn2", "L1_turn3"]
+    assert body["metadata"]["limit"] == 2
+    assert body["metadata"]["offset"] == 1
+    assert body["metadata"]["due_count"] == 5
+    assert body["metadata"]["page_count"] == 2
+    assert database.page_requests == [(2, 1)]
+
+
+def test_review_get_rejects_oversized_page(client, stub_context):
+    response = client.get("/api/review/due", params={"user_id": 7, "limit": 500})
+    assert response.status_code == 422
+
+
+def test_review_get_loads_each_lesson_once(client, stub_context):
+    lesson_manager = stub_context["lesson_manager"]
+    requested = []
+    original_get_lesson = lesson_manager.get_lesson
+
+    def counting_get_lesson(lesson_id):
+        requested.append(lesson_id)
+        return original_get_lesson(lesson_id)
+
+    lesson_manager.get_lesson = counting_get_lesson
+    stub_context["database"].due_items = [
+        StubDueItem("L1_turn1", user_id=7),
+        StubDueItem("L1_turn2", user_id=7),
+        StubDueItem("L1_turn3", user_id=7),
+    ]
+
+    response = client.get("/api/review/due", params={"user_id": 7})
+
+    assert response.status_code == 200
+    assert len(response.json()["data"]) == 3
+    assert requested == ["L1"]
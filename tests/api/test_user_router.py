@@ -5,6 +5,7 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from src.api.routers.user import router
+from src.services.user_stats_cache import invalidate_user_stats_cache
 from src.core.app_context import app_context
 
 
@@ -26,15 +27,26 @@ class StubDatabase:
         self.raise_on_attempts = raise_on_attempts
         self.calls = []
 
-    def get_user_attempts(self, user_id):
+    def get_user_attempt_summary(self, user_id):
         if self.raise_on_attempts:
             raise RuntimeError("database error")
+        self.calls.append(("get_user_attempt_summary", user_id))
+        scores = [a.score for a in self.attempts if a.score is not None]
+        return len(self.attempts), float(sum(scores))
+
+    def get_user_attempts(self, user_id, limit=None):
         self.calls.append(("get_user_attempts", user_id))
-        return list(self.attempts)
+        attempts = sorted(
+            self.attempts,
+            key=lambda a: a.created_at or datetime.min,
+            reverse=True,
+        )
+        return attempts[:limit] if limit else attempts
 
-    def get_user_progresses(self, user_id):
-        self.calls.append(("get_user_progresses", user_id))
-        return list(self.progresses)
+    def get_user_progress_counts(self, user_id):
+        self.calls.append(("get_user_progress_counts", user_id))
+        completed = sum(1 for p in self.progresses if p.status == "completed")
+        return completed, len(self.progresses)
 
 
 @pytest.fixture
@@ -49,10 +61,12 @@ def stub_database():
     original_database = getattr(app_context, "_database", None)
     stub = StubDatabase()
     app_context._database = stub
+    invalidate_user_stats_cache()
     try:
         yield stub
     finally:
         app_context._database = original_database
+        invalidate_user_stats_cache()
 
 
 def test_user_stats_returns_defaults_when_no_attempts(client, stub_database):
@@ -91,3 +105,30 @@ def test_user_stats_handles_error(client, stub_database):
     response = client.get("/api/user/stats", params={"user_id": 6})
     assert response.status_code == 500
     assert "internal server error" in response.json()["detail"].lower()
+
+
+def test_user_stats_trend_is_limited_to_recent_attempts(client, stub_database):
+    now = datetime.utcnow()
+    stub_database.attempts = [
+        StubAttempt(0.5, now - timedelta(minutes=i)) for i in range(15)
+    ]
+
+    response = client.get("/api/user/stats", params={"user_id": 5})
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["total_attempts"] == 15
+    assert len(data["accuracy_trend"]) == 10
+
+
+def test_user_stats_served_from_cache_until_invalidated(client, stub_database):
+    stub_database.attempts = [StubAttempt(0.5, datetime.utcnow())]
+
+    first = client.get("/api/user/stats", params={"user_id": 5}).json()
+    stub_database.attempts.append(StubAttempt(1.0, datetime.utcnow()))
+    cached = client.get("/api/user/stats", params={"user_id": 5}).json()
+    assert cached == first
+    assert stub_database.calls.count(("get_user_attempt_summary", 5)) == 1
+
+    invalidate_user_stats_cache(5)
+    fresh = client.get("/api/user/stats", params={"user_id": 5}).json()
+    assert fresh["data"]["total_attempts"] == 2
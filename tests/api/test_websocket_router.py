@@ -7,7 +7,7 @@ from fastapi import FastAPI, WebSocket
 from fastapi.testclient import TestClient
 from starlette.websockets import WebSocketDisconnect
 
-from src.api.routers.websocket import websocket_chat, manager
+from src.api.routers.websocket import MAX_MESSAGE_LENGTH, websocket_chat, manager
 from src.core.app_context import app_context
 
 
@@ -94,6 +94,15 @@ def test_websocket_missing_fields(ws_client):
         assert "Missing required fields" in error_msg["message"]
 
 
+def test_websocket_rejects_oversized_message(ws_client):
+    _, stub_tutor = ws_client
+    with _connected_socket(ws_client) as websocket:
+        websocket.send_text("x" * (MAX_MESSAGE_LENGTH + 1))
+        error_msg = websocket.receive_json()
+        assert error_msg == {"type": "error", "message": "Message too large"}
+    assert stub_tutor.calls == []
+
+
 def test_websocket_unknown_message_type(ws_client):
     with _connected_socket(ws_client) as websocket:
         websocket.send_json({"type": "mystery"})
@@ -149,3 +158,33 @@ def test_connection_manager_disconnect_on_close(ws_client):
         pass
 
     assert manager.active_connections == {}
+
+
+class _RecordingSocket:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.sent = []
+
+    async def send_text(self, payload):
+        if self.fail:
+            raise RuntimeError("closed")
+        self.sent.append(payload)
+
+
+def test_connection_manager_broadcast_encodes_once_and_drops_failures():
+    sockets = {user_id: _RecordingSocket() for user_id in range(5)}
+    sockets[3] = _RecordingSocket(fail=True)
+    manager.active_connections.clear()
+    manager.active_connections.update(sockets)
+
+    try:
+        asyncio.run(manager.broadcast({"type": "notice", "message": "hej"}, batch=2))
+
+        delivered = [sock.sent for uid, sock in sockets.items() if uid != 3]
+        assert all(
+            sent == ['{"type": "notice", "message": "hej"}'] for sent in delivered
+        )
+        assert 3 not in manager.active_connections
+        assert len(manager.active_connections) == 4
+    finally:
+        manager.active_connections.clear()
@@ -2,6 +2,7 @@ import importlib.machinery
 import sys
 import types
 from pathlib import Path
+from typing import Optional
 
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -71,7 +72,10 @@ if "openai" not in sys.modules:
 if "Levenshtein" not in sys.modules:
     levenshtein_module = _ensure_module("Levenshtein")
 
-    def _distance(a: str, b: str) -> int:
+    def _distance(a: str, b: str, score_cutoff: Optional[int] = None) -> int:
+        if score_cutoff is not None:
+            # Like Levenshtein: anything above the cutoff is cutoff + 1
+            return min(_distance(a, b), score_cutoff + 1)
         if a == b:
             return 0
         if not a:
@@ -216,12 +220,25 @@ if "sqlalchemy" not in sys.modules:
     def and_(*conditions):
         return conditions
 
+    def insert(table):
+        return ("insert", table)
+
+    def case(*whens, **kwargs):
+        return ("case", whens, kwargs)
+
+    class _Functions:
+        def __getattr__(self, name):
+            return lambda *args: (name, args)
+
     sqlalchemy_module.Column = Column
     sqlalchemy_module.DateTime = DateTime
     sqlalchemy_module.Index = Index
     sqlalchemy_module.String = String
     sqlalchemy_module.Text = Text
     sqlalchemy_module.and_ = and_
+    sqlalchemy_module.case = case
+    sqlalchemy_module.insert = insert
+    sqlalchemy_module.func = _Functions()
 
     orm_module.sessionmaker = sessionmaker
     orm_module.declarative_base = declarative_base
@@ -198,3 +198,30 @@ class TestAppContext:
         config1 = context1.config
         config2 = context2.config
         assert config1 is not config2
+
+    @patch("src.core.app_context.SpeechEngine")
+    def test_speech_engine_property_is_lazy(self, mock_speech_engine_class):
+        """Test speech_engine is created on first access and then reused."""
+        context = AppContext()
+        assert context._speech_engine is None
+        mock_speech_engine_class.assert_not_called()
+
+        engine1 = context.speech_engine
+        engine2 = context.speech_engine
+
+        mock_speech_engine_class.assert_called_once()
+        assert engine1 is engine2
+
+    @patch("src.core.app_context.load_dotenv")
+    def test_dotenv_parsed_once_per_process(self, mock_load_dotenv):
+        """Test .env is parsed once even when several contexts load config."""
+        from src.core.app_context import _load_dotenv_once
+
+        _load_dotenv_once.cache_clear()
+        try:
+            AppContext().config
+            AppContext().config
+
+            mock_load_dotenv.assert_called_once()
+        finally:
+            _load_dotenv_once.cache_clear()
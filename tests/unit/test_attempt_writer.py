@@ -0,0 +1,70 @@
+"""Unit tests for the batched attempt writer."""
+
+import threading
+
+from src.services.attempt_writer import AttemptWriter
+
+
+class RecordingDatabase:
+    def __init__(self):
+        self.batches = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def create_attempts_bulk(self, rows):
+        self.release.wait()
+        self.batches.append(list(rows))
+        return len(rows)
+
+
+def test_attempt_writer_batches_queued_rows():
+    database = RecordingDatabase()
+    database.release.clear()
+    writer = AttemptWriter(database, batch_size=3, max_delay=0.5)
+    try:
+        for i in range(7):
+            writer.submit({"phrase_id": f"p{i}"})
+        database.release.set()
+        writer.flush()
+    finally:
+        writer.stop()
+
+    rows = [row["phrase_id"] for batch in database.batches for row in batch]
+    assert rows == [f"p{i}" for i in range(7)]
+    assert all(len(batch) <= 3 for batch in database.batches)
+    assert len(database.batches) < 7
+
+
+def test_attempt_writer_stop_writes_pending_rows():
+    database = RecordingDatabase()
+    writer = AttemptWriter(database, max_delay=10)
+    writer.submit({"phrase_id": "p0"})
+    writer.stop()
+
+    assert database.batches == [[{"phrase_id": "p0"}]]
+
+
+def test_attempt_writer_writes_inline_when_queue_is_full():
+    database = RecordingDatabase()
+    writer = AttemptWriter(database, maxsize=1)
+    writer.stop()
+
+    writer._queue.put_nowait({"phrase_id": "queued"})
+    writer.submit({"phrase_id": "inline"})
+
+    assert database.batches == [[{"phrase_id": "inline"}]]
+
+
+def test_attempt_writer_invalidates_user_stats_after_write():
+    from src.services.user_stats_cache import user_stats_cache
+
+    user_stats_cache.store(7, user_stats_cache.generation(7), {"cached": True})
+    database = RecordingDatabase()
+    writer = AttemptWriter(database)
+    try:
+        writer.submit({"user_id": 7, "phrase_id": "p0"})
+        writer.flush()
+    finally:
+        writer.stop()
+
+    assert user_stats_cache.get(7) is None
@@ -3,7 +3,17 @@ from pathlib import Path
 
 import pytest
 
-from src.core.lesson_manager import LessonManager
+from pydantic import ValidationError
+
+from src.core.lesson_manager import (
+    _LESSON_VALIDATOR,
+    DEFAULT_LESSON_DIR,
+    LESSON_SCHEMA,
+    DialogueModel,
+    LessonManager,
+    LessonModel,
+    OptionModel,
+)
 
 
 def _write_lesson_file(directory: Path, lesson_id: str, data: dict) -> None:
@@ -142,3 +152,83 @@ def test_load_lesson_catalog_flattens_entries(tmp_path):
     assert any(
         entry["module"] == "Moduł 1" for entry in entries if entry["id"] == "lesson_b"
     )
+
+
+@pytest.mark.parametrize(
+    ("model", "schema"),
+    [
+        (LessonModel, LESSON_SCHEMA),
+        (DialogueModel, LESSON_SCHEMA["properties"]["dialogues"]["items"]),
+        (
+            OptionModel,
+            LESSON_SCHEMA["properties"]["dialogues"]["items"]["properties"]["options"][
+                "items"
+            ],
+        ),
+    ],
+)
+def test_lesson_models_declare_the_schema_fields(model, schema):
+    fields = model.model_fields
+    assert set(fields) == set(schema["properties"])
+    required = {name for name, field in fields.items() if field.is_required()}
+    assert required == set(schema["required"])
+
+
+def _mutated_lesson(mutate):
+    lesson = _sample_lesson()
+    mutate(lesson)
+    return lesson
+
+
+def _set(path, value):
+    def mutate(lesson):
+        target = lesson
+        for key in path[:-1]:
+            target = target[key]
+        target[path[-1]] = value
+
+    return mutate
+
+
+def _drop(path):
+    def mutate(lesson):
+        target = lesson
+        for key in path[:-1]:
+            target = target[key]
+        del target[path[-1]]
+
+    return mutate
+
+
+PARITY_CASES = [
+    _sample_lesson(),
+    *(
+        json.loads(path.read_text(encoding="utf-8"))
+        for path in sorted(DEFAULT_LESSON_DIR.glob("*.json"))[:5]
+        if path.name != "catalog.json"
+    ),
+    _mutated_lesson(_drop(["title"])),
+    _mutated_lesson(_set(["level"], 1)),
+    _mutated_lesson(_set(["cefr_goal"], None)),
+    _mutated_lesson(_set(["tags"], ["greetings", 3])),
+    _mutated_lesson(_set(["dialogues"], [])),
+    _mutated_lesson(_set(["extra"], {"kept": True})),
+    _mutated_lesson(_drop(["dialogues", 0, "tutor"])),
+    _mutated_lesson(_set(["dialogues", 0, "expected"], [])),
+    _mutated_lesson(_set(["dialogues", 0, "hint"], None)),
+    _mutated_lesson(_set(["dialogues", 0, "audio"], 5)),
+    _mutated_lesson(_set(["dialogues", 0, "options"], "turn_002")),
+    _mutated_lesson(_drop(["dialogues", 0, "options", 0, "next"])),
+    _mutated_lesson(_set(["dialogues", 0, "options", 2, "default"], "yes")),
+    _mutated_lesson(_set(["dialogues", 0, "options", 2, "default"], 1)),
+]
+
+
+@pytest.mark.parametrize("lesson", PARITY_CASES)
+def test_lesson_models_agree_with_schema(lesson):
+    try:
+        LessonModel.model_validate(lesson)
+        model_valid = True
+    except ValidationError:
+        model_valid = False
+    assert model_valid == _LESSON_VALIDATOR.is_valid(lesson)
@@ -1,4 +1,6 @@
 import json
+import os
+import sys
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -164,3 +166,231 @@ def test_load_lesson_catalog_handles_nested_structure(tmp_path):
 
     assert len(entries) == 2
     assert entries[0]["id"] == "p1"
+
+
+def test_load_lesson_catalog_cached_until_file_changes(tmp_path):
+    lessons_dir = tmp_path / "lessons"
+    lessons_dir.mkdir()
+    catalog_file = lessons_dir / "catalog.json"
+    catalog = {"parts": [{"title": "Part A", "lessons": [{"id": "p1"}]}]}
+    catalog_file.write_text(json.dumps(catalog), encoding="utf-8")
+
+    manager = LessonManager(lessons_dir=str(lessons_dir))
+    first = manager.load_lesson_catalog()
+    assert [entry["id"] for entry in first] == ["p1"]
+
+    # Served from cache while the file is unchanged
+    first.clear()
+    assert [entry["id"] for entry in manager.load_lesson_catalog()] == ["p1"]
+
+    # A newer catalog.json invalidates the cached entries
+    catalog["parts"][0]["lessons"].append({"id": "p2"})
+    catalog_file.write_text(json.dumps(catalog), encoding="utf-8")
+    stat = catalog_file.stat()
+    os.utime(catalog_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert [entry["id"] for entry in manager.load_lesson_catalog()] == ["p1", "p2"]
+
+
+def test_validate_dialogues_reports_missing_audio_from_directory_listing(
+    tmp_path, caplog
+):
+    audio_dir = tmp_path / "audio" / "demo"
+    audio_dir.mkdir(parents=True)
+    (audio_dir / "demo_d1.mp3").write_bytes(b"")
+
+    manager = LessonManager(
+        lessons_dir=str(tmp_path / "lessons"),
+        audio_base_dir=str(tmp_path / "audio"),
+    )
+    lesson = {
+        "id": "demo",
+        "dialogues": [
+            {"id": "d1", "audio": "demo_d1.mp3", "audio_slow": "demo_d1_slow.mp3"},
+        ],
+    }
+
+    with caplog.at_level("WARNING"):
+        manager._validate_dialogues(lesson)
+
+    assert "demo_d1_slow.mp3" in caplog.text
+    assert "demo_d1.mp3'" not in caplog.text
+
+
+def test_load_all_lessons_restores_snapshot_until_files_change(tmp_path, monkeypatch):
+    lessons_dir = tmp_path / "lessons"
+    lessons_dir.mkdir()
+    _write_lesson(lessons_dir, "demo")
+
+    first = LessonManager(
+        lessons_dir=str(lessons_dir), audio_base_dir=str(tmp_path / "audio")
+    ).load_all_lessons()
+    assert list(first) == ["demo"]
+    assert len(list((lessons_dir / ".cache").glob("all-valid-*.json"))) == 1
+
+    def _no_parse(self, lesson_id, validate):
+        raise AssertionError("lesson files should come from the snapshot")
+
+    monkeypatch.setattr(LessonManager, "_load_lesson_safe", _no_parse)
+    manager = LessonManager(
+        lessons_dir=str(lessons_dir), audio_base_dir=str(tmp_path / "audio")
+    )
+    restored = manager.load_all_lessons()
+    assert restored == first
+    assert manager.get_lesson("demo") == first["demo"]
+
+    monkeypatch.undo()
+    _write_lesson(lessons_dir, "demo2")
+    reloaded = LessonManager(
+        lessons_dir=str(lessons_dir), audio_base_dir=str(tmp_path / "audio")
+    ).load_all_lessons()
+    assert set(reloaded) == {"demo", "demo2"}
+    assert len(list((lessons_dir / ".cache").glob("*.json"))) == 1
+
+
+def test_load_all_lessons_reports_failures_restored_from_snapshot(
+    tmp_path, caplog, monkeypatch
+):
+    lessons_dir = tmp_path / "lessons"
+    lessons_dir.mkdir()
+    _write_lesson(lessons_dir, "good")
+    _write_lesson(lessons_dir, "bad", with_default=False)
+
+    def load():
+        return LessonManager(
+            lessons_dir=str(lessons_dir), audio_base_dir=str(tmp_path / "audio")
+        ).load_all_lessons()
+
+    assert set(load()) == {"good"}
+    assert len(list((lessons_dir / ".cache").glob("all-valid-*.json"))) == 1
+    caplog.clear()
+
+    def _no_parse(self, lesson_id, validate):
+        raise AssertionError("lesson files should come from the snapshot")
+
+    monkeypatch.setattr(LessonManager, "_load_lesson_safe", _no_parse)
+    assert set(load()) == {"good"}
+    assert any(
+        "Failed to load lesson bad" in message and "default option" in message
+        for message in caplog.messages
+    )
+
+
+class BulkStubDatabase(StubDatabase):
+    def __init__(self):
+        super().__init__()
+        self.bulk_calls = []
+
+    def create_lesson_with_phrases(self, phrase_rows, **kwargs):
+        self.bulk_calls.append(phrase_rows)
+        return self.create_lesson(**kwargs)
+
+
+def test_save_lesson_to_db_inserts_phrases_in_one_call(tmp_path):
+    lessons_dir = tmp_path / "lessons"
+    lessons_dir.mkdir()
+    lesson_data = _write_lesson(lessons_dir, "demo")
+
+    db = BulkStubDatabase()
+    manager = LessonManager(
+        lessons_dir=str(lessons_dir),
+        audio_base_dir=str(tmp_path / "audio"),
+        database=db,
+    )
+
+    saved = manager.save_lesson_to_db("demo")
+    assert saved.lesson_id == "demo"
+    assert db.created_phrases == []
+    (rows,) = db.bulk_calls
+    assert [row["id"] for row in rows] == [d["id"] for d in lesson_data["dialogues"]]
+    assert rows[0]["audio_path"] == "demo/demo_d1.mp3"
+    assert rows[1]["audio_path"] is None
+
+
+def test_load_lesson_reloads_when_file_changes(tmp_path):
+    lessons_dir = tmp_path / "lessons"
+    lessons_dir.mkdir()
+    lesson = _write_lesson(lessons_dir, "demo")
+    lesson_file = lessons_dir / "demo.json"
+
+    manager = LessonManager(
+        lessons_dir=str(lessons_dir), audio_base_dir=str(tmp_path / "audio")
+    )
+    first = manager.load_lesson("demo")
+    assert manager.load_lesson("demo") is first
+
+    lesson["title"] = "Edited Lesson"
+    lesson_file.write_text(json.dumps(lesson), encoding="utf-8")
+    stat = lesson_file.stat()
+    os.utime(lesson_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert manager.load_lesson("demo")["title"] == "Edited Lesson"
+    assert manager.get_lesson("demo")["title"] == "Edited Lesson"
+
+
+def test_load_all_lessons_drops_lessons_with_broken_branches(tmp_path, caplog):
+    lessons_dir = tmp_path / "lessons"
+    lessons_dir.mkdir()
+    _write_lesson(lessons_dir, "good")
+    bad_lesson = _write_lesson(lessons_dir, "bad")
+    bad_lesson["dialogues"][0]["options"][0]["next"] = "elsewhere_d9"
+    (lessons_dir / "bad.json").write_text(json.dumps(bad_lesson), encoding="utf-8")
+
+    manager = LessonManager(
+        lessons_dir=str(lessons_dir), audio_base_dir=str(tmp_path / "audio")
+    )
+    lessons = manager.load_all_lessons()
+
+    assert set(lessons) == {"good"}
+    assert "bad" not in manager._cache
+    assert any("Failed to load lesson bad" in m for m in caplog.messages)
+
+
+def test_load_lesson_interns_dialogue_ids(tmp_path):
+    lessons_dir = tmp_path / "lessons"
+    lessons_dir.mkdir()
+    _write_lesson(lessons_dir, "demo")
+
+    manager = LessonManager(
+        lessons_dir=str(lessons_dir), audio_base_dir=str(tmp_path / "audio")
+    )
+    lesson = manager.load_lesson("demo")
+
+    first, second = lesson["dialogues"]
+    assert first["options"][0]["next"] is second["id"]
+    assert lesson["id"] is sys.intern("demo")
+
+
+def test_load_lesson_rejects_schema_violations(tmp_path):
+    lessons_dir = tmp_path / "lessons"
+    lessons_dir.mkdir()
+    lesson = _write_lesson(lessons_dir, "demo")
+    lesson["dialogues"][0]["audio"] = None
+    (lessons_dir / "demo.json").write_text(json.dumps(lesson), encoding="utf-8")
+
+    manager = LessonManager(
+        lessons_dir=str(lessons_dir), audio_base_dir=str(tmp_path / "audio")
+    )
+
+    with pytest.raises(ValueError, match="Invalid lesson schema: None is not"):
+        manager.load_lesson("demo")
+
+
+def test_load_all_lessons_catalog_only_skips_unlisted_lessons(tmp_path):
+    lessons_dir = tmp_path / "lessons"
+    lessons_dir.mkdir()
+    _write_lesson(lessons_dir, "published")
+    _write_lesson(lessons_dir, "draft")
+    catalog = {"parts": [{"title": "Part A", "lessons": [{"id": "published"}]}]}
+    (lessons_dir / "catalog.json").write_text(json.dumps(catalog), encoding="utf-8")
+
+    manager = LessonManager(
+        lessons_dir=str(lessons_dir), audio_base_dir=str(tmp_path / "audio")
+    )
+
+    assert set(manager.load_all_lessons(catalog_only=True)) == {"published"}
+    assert set(manager.load_all_lessons()) == {"published", "draft"}
+
+    # Each load mode keeps its own snapshot instead of evicting the other
+    snapshots = sorted(p.name.split("-")[0] for p in (lessons_dir / ".cache").iterdir())
+    assert snapshots == ["all", "catalog"]
@@ -145,3 +145,168 @@ def test_setup_logging_formatter_configuration(tmp_path):
     assert "Format test message" in content
     # Should contain timestamp in YYYY-MM-DD HH:MM:SS format
     assert len(content.split(" - ")) >= 4  # date, time, level, logger, message
+
+
+def test_setup_structured_logging_routes_records_through_queue(tmp_path):
+    """Root logger only enqueues; the listener writes JSON with exceptions."""
+    import json
+    from logging.handlers import QueueHandler
+
+    from src.core.logging_config import setup_structured_logging
+
+    log_dir = tmp_path / "logs_queue"
+    setup_structured_logging(str(log_dir), console_output=False)
+
+    root_handlers = logging.getLogger().handlers
+    assert len(root_handlers) == 1
+    assert isinstance(root_handlers[0], QueueHandler)
+
+    try:
+        raise ValueError("queued failure")
+    except ValueError:
+        logging.getLogger("queue_test").exception("Queued %s", "message")
+    root_handlers[0].flush()
+
+    last_line = (log_dir / "app.log").read_text().strip().splitlines()[-1]
+    entry = json.loads(last_line)
+    assert entry["message"] == "Queued message"
+    assert "ValueError: queued failure" in entry["exception"]
+
+
+def test_structured_json_formatter_output_is_stable(monkeypatch):
+    """JSON output keeps the Z timestamp with and without orjson."""
+    import json
+
+    import src.core.logging_config as logging_config_module
+
+    record = logging.LogRecord(
+        "json_test", logging.INFO, __file__, 1, "Value %s", (1,), None
+    )
+    record.big_number = 2**70
+    formatter = logging_config_module.StructuredJSONFormatter()
+
+    with_orjson = json.loads(formatter.format(record))
+    monkeypatch.setattr(logging_config_module, "orjson", None)
+    without_orjson = json.loads(formatter.format(record))
+
+    for entry in (with_orjson, without_orjson):
+        assert entry["message"] == "Value 1"
+        assert entry["timestamp"].endswith("Z")
+        assert entry["extra_big_number"] == 2**70
+        assert entry["process"] == os.getpid()
+
+
+def test_structured_json_formatter_uses_record_time():
+    """Entries formatted later by the listener keep the event's time."""
+    import json
+
+    import src.core.logging_config as logging_config_module
+
+    record = logging.LogRecord("json_test", logging.INFO, __file__, 1, "msg", (), None)
+    record.created = 1_700_000_000.25
+    formatter = logging_config_module.StructuredJSONFormatter()
+
+    entry = json.loads(formatter.format(record))
+    assert entry["timestamp"] == "2023-11-14T22:13:20.250000Z"
+
+
+def test_request_context_ids_are_isolated_per_task():
+    """Concurrent asyncio tasks each see their own request ID."""
+    import asyncio
+
+    from src.core.logging_config import (
+        get_request_id,
+        reset_request_id,
+        set_request_id,
+    )
+
+    async def handle(request_id):
+        token = set_request_id(request_id)
+        try:
+            await asyncio.sleep(0)
+            return get_request_id()
+        finally:
+            reset_request_id(token)
+
+    async def main():
+        return await asyncio.gather(handle("req-1"), handle("req-2"))
+
+    assert asyncio.run(main()) == ["req-1", "req-2"]
+    assert get_request_id() is None
+
+
+def test_setup_structured_logging_sets_debug_enabled(tmp_path):
+    import src.core.logging_config as logging_config_module
+
+    logging_config_module.setup_structured_logging(
+        str(tmp_path / "debug"), log_level="DEBUG", console_output=False
+    )
+    assert logging_config_module.DEBUG_ENABLED is True
+
+    logging_config_module.setup_structured_logging(
+        str(tmp_path / "info"), log_level="INFO", console_output=False
+    )
+    assert logging_config_module.DEBUG_ENABLED is False
+
+
+def test_generate_correlation_id_is_uuid4():
+    import uuid
+
+    from src.core.logging_config import generate_correlation_id
+
+    ids = {generate_correlation_id() for _ in range(100)}
+    assert len(ids) == 100
+    for value in ids:
+        parsed = uuid.UUID(value)
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
+        assert str(parsed) == value
+
+
+def test_queued_records_carry_request_context(tmp_path):
+    """IDs bound with set_request_id reach the JSON written by the listener."""
+    import json
+
+    from src.core.logging_config import (
+        reset_request_id,
+        set_request_id,
+        setup_structured_logging,
+    )
+
+    log_dir = tmp_path / "logs_context"
+    setup_structured_logging(str(log_dir), console_output=False)
+
+    token = set_request_id("req-42")
+    try:
+        logging.getLogger("context_test").info("with context")
+    finally:
+        reset_request_id(token)
+    logging.getLogger().handlers[0].flush()
+
+    last_line = (log_dir / "app.log").read_text().strip().splitlines()[-1]
+    assert json.loads(last_line)["request_id"] == "req-42"
+
+
+def test_full_log_queue_drops_info_but_keeps_warnings():
+    """A full queue drops low-level records and reports them once it drains."""
+    import queue
+
+    from src.core.logging_config import _ListenerQueueHandler
+
+    log_queue: queue.Queue = queue.Queue(maxsize=2)
+    handler = _ListenerQueueHandler(log_queue)
+    log = logging.getLogger("queue_full_test")
+
+    def record(level, msg):
+        return log.makeRecord(log.name, level, __file__, 0, msg, (), None)
+
+    for msg in ("kept", "kept too", "dropped"):
+        handler.handle(record(logging.INFO, msg))
+    assert handler.dropped == 1
+    assert log_queue.get_nowait().getMessage() == "kept"
+    assert log_queue.get_nowait().getMessage() == "kept too"
+
+    handler.handle(record(logging.WARNING, "after drain"))
+    assert handler.dropped == 0
+    assert log_queue.get_nowait().getMessage() == "Log queue full; dropped 1 records"
+    assert log_queue.get_nowait().getMessage() == "after drain"
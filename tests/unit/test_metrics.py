@@ -0,0 +1,48 @@
+"""Unit tests for Prometheus metrics helpers."""
+
+import pytest
+
+from src.core.metrics import _endpoint_path
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("/api/tts/status/job-1", "/api/tts/status/{job_id}"),
+        ("/api/tts/status", "/api/tts/status/{job_id}"),
+        ("/api/tts/statusx/1", "/api/tts/statusx/1"),
+        ("/audio_cache_v2/L1_turn1.mp3", "/audio_cache_v2/{filename}"),
+        ("/api/lesson/list", "/api/lesson/list"),
+    ],
+)
+def test_endpoint_path_uses_route_templates(path, expected):
+    assert _endpoint_path(path) == expected
+
+
+def test_metrics_middleware_records_requests_through_cached_recorders():
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from src.core.metrics import (
+        MetricsMiddleware,
+        _RECORDERS,
+        http_requests_total,
+    )
+
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/api/tts/status/{job_id}")
+    def status(job_id: str):
+        return {"job_id": job_id}
+
+    counter = http_requests_total.labels("GET", "/api/tts/status/{job_id}", "200")
+    before = counter._value.get()
+
+    client = TestClient(app)
+    client.get("/api/tts/status/a")
+    client.get("/api/tts/status/b")
+
+    assert counter._value.get() == before + 2
+    key = (http_requests_total, "GET", "/api/tts/status/{job_id}", "200")
+    assert _RECORDERS[key] == counter.inc
@@ -0,0 +1,152 @@
+"""Unit tests for request ID and logging middleware."""
+
+import logging
+import uuid
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.core.middleware import ObservabilityMiddleware, _IdPool
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(ObservabilityMiddleware)
+
+    @app.get("/ping")
+    def ping(request: Request):
+        return {"request_id": request.state.request_id}
+
+    @app.get("/boom")
+    def boom():
+        raise RuntimeError("boom")
+
+    @app.get("/health")
+    def health():
+        return {"status": "ok"}
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_id_pool_returns_unique_version_4_uuids():
+    pool = _IdPool()
+    ids = {pool.next_id() for _ in range(200)}
+    assert len(ids) == 200
+    for value in ids:
+        parsed = uuid.UUID(value)
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
+        assert str(parsed) == value
+
+
+def test_observability_middleware_generates_ids():
+    response = _client().get("/ping")
+
+    assert uuid.UUID(response.headers["X-Request-ID"]).version == 4
+    assert response.json() == {"request_id": response.headers["X-Request-ID"]}
+    assert uuid.UUID(response.headers["X-Correlation-ID"]).version == 4
+
+
+def test_observability_middleware_propagates_incoming_ids():
+    response = _client().get(
+        "/ping", headers={"X-Request-ID": "req-1", "X-Correlation-ID": "corr-1"}
+    )
+
+    assert response.headers["X-Request-ID"] == "req-1"
+    assert response.headers["X-Correlation-ID"] == "corr-1"
+
+
+def test_observability_middleware_reads_raw_request_headers(caplog):
+    caplog.set_level(logging.INFO, logger="src.core.middleware")
+    app = FastAPI()
+    app.add_middleware(ObservabilityMiddleware, header_name="X-Trace-ID")
+
+    @app.post("/echo")
+    def echo(request: Request):
+        return {"request_id": request.state.request_id}
+
+    response = TestClient(app).post(
+        "/echo",
+        content=b"hello",
+        headers=[("X-Trace-ID", "trace-1"), ("X-Trace-ID", "trace-2")],
+    )
+
+    assert response.json() == {"request_id": "trace-1"}
+    assert response.headers["X-Trace-ID"] == "trace-1"
+    started = next(r for r in caplog.records if r.name == "src.core.middleware")
+    assert started.request_size == "5"
+    assert started.user_agent == "testclient"
+
+
+def test_id_pool_refreshes_prefix_when_counter_runs_out(monkeypatch):
+    monkeypatch.setattr(_IdPool, "REFRESH_EVERY", 2)
+    pool = _IdPool()
+
+    first, second, third = (pool.next_id() for _ in range(3))
+
+    assert first[:28] == second[:28]
+    assert third[:28] != first[:28]
+    assert third.endswith("00000000")
+
+
+def test_observability_middleware_turns_errors_into_json_500(caplog):
+    response = _client().get("/boom", headers={"X-Request-ID": "req-err"})
+
+    assert response.status_code == 500
+    assert response.headers["X-Request-ID"] == "req-err"
+    assert response.json() == {
+        "status": "error",
+        "message": "Internal server error",
+        "request_id": "req-err",
+    }
+    assert "Unhandled exception in request" in caplog.messages
+
+
+def test_observability_middleware_logs_each_request_once(caplog):
+    caplog.set_level(logging.INFO, logger="src.core.middleware")
+
+    _client().get("/ping")
+
+    records = [r for r in caplog.records if r.name == "src.core.middleware"]
+    assert [r.getMessage() for r in records] == [
+        "Request started: GET /ping",
+        "Request completed: GET /ping",
+    ]
+    assert records[-1].http_status == 200
+
+
+def test_observability_middleware_does_not_log_polled_paths(caplog):
+    caplog.set_level(logging.INFO, logger="src.core.middleware")
+
+    client = _client()
+    responses = [client.get(path) for path in ("/health", "/openapi.json", "/docs")]
+
+    assert [r.status_code for r in responses] == [200, 200, 200]
+    assert all("X-Request-ID" in r.headers for r in responses)
+    assert [r for r in caplog.records if r.name == "src.core.middleware"] == []
+
+
+def test_observability_middleware_logs_one_error_per_exception(caplog):
+    _client().get("/boom")
+
+    errors = [record for record in caplog.records if record.levelno == logging.ERROR]
+    assert [record.getMessage() for record in errors] == [
+        "Unhandled exception in request"
+    ]
+
+
+def test_error_body_matches_json_encoding(monkeypatch):
+    import json
+
+    from src.core import middleware
+
+    for request_id in ("abc-123", 'quote"d', None):
+        expected = {
+            "status": "error",
+            "message": "Internal server error",
+            "request_id": request_id,
+        }
+        assert json.loads(middleware._error_body(request_id)) == expected
+        monkeypatch.setattr(middleware, "orjson", None)
+        assert json.loads(middleware._error_body(request_id)) == expected
+        monkeypatch.undo()
@@ -0,0 +1,13 @@
+"""Unit tests for the shared OpenAI client factory."""
+
+from src.services.openai_client import get_openai_client
+
+
+def test_get_openai_client_is_shared_per_api_key():
+    get_openai_client.cache_clear()
+    try:
+        client = get_openai_client("sk-test")
+        assert get_openai_client("sk-test") is client
+        assert get_openai_client("sk-other") is not client
+    finally:
+        get_openai_client.cache_clear()
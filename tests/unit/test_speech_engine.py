@@ -2,7 +2,7 @@ import os
 import time
 from pathlib import Path
 
-from src.services.speech_engine import SpeechEngine
+from src.services.speech_engine import NATIVE_AUDIO_INDEX_TTL, SpeechEngine
 
 
 def test_generate_cache_key_is_deterministic():
@@ -100,3 +100,90 @@ def test_cleanup_cache_removes_old_files(tmp_path):
     removed = engine.cleanup_cache(max_age_days=30)
     assert removed >= 1
     assert not old_file.exists()
+
+
+def test_pre_recorded_lookup_uses_native_manifest(tmp_path, monkeypatch):
+    lesson_dir = tmp_path / "native" / "lesson1"
+    lesson_dir.mkdir(parents=True)
+    (lesson_dir / "phrase_001.mp3").write_bytes(b"normal")
+
+    engine = SpeechEngine(
+        native_audio_dir=str(tmp_path / "native"),
+        cache_dir=str(tmp_path / "cache"),
+        murf_api_key="test-key",
+    )
+    first = engine._check_pre_recorded("lesson1", "phrase_001", None, 1.0)
+    assert first == lesson_dir / "phrase_001.mp3"
+    assert engine.native_audio_index == frozenset({"lesson1/phrase_001.mp3"})
+
+    def _fail_exists(self):
+        raise AssertionError("exists() should not be called after indexing")
+
+    monkeypatch.setattr(Path, "exists", _fail_exists)
+    assert engine._check_pre_recorded("lesson1", "phrase_001", None, 1.0) == first
+    assert engine._check_pre_recorded("lesson1", "missing", None, 1.0) is None
+
+
+def test_refresh_native_audio_index_picks_up_new_files(tmp_path):
+    lesson_dir = tmp_path / "native" / "lesson1"
+    lesson_dir.mkdir(parents=True)
+    (lesson_dir / "phrase_001.mp3").write_bytes(b"normal")
+    (lesson_dir / "notes.txt").write_text("not audio")
+
+    engine = SpeechEngine(
+        native_audio_dir=str(tmp_path / "native"),
+        cache_dir=str(tmp_path / "cache"),
+        murf_api_key="test-key",
+    )
+    assert engine.native_audio_index == frozenset({"lesson1/phrase_001.mp3"})
+
+    (lesson_dir / "phrase_002.mp3").write_bytes(b"new")
+    assert engine._check_pre_recorded("lesson1", "phrase_002", None, 1.0) is None
+
+    engine.refresh_native_audio_index()
+    assert engine._check_pre_recorded("lesson1", "phrase_002", None, 1.0) == (
+        lesson_dir / "phrase_002.mp3"
+    )
+
+
+def test_native_audio_index_is_rescanned_after_ttl(tmp_path):
+    lesson_dir = tmp_path / "native" / "lesson1"
+    lesson_dir.mkdir(parents=True)
+    (lesson_dir / "phrase_001.mp3").write_bytes(b"normal")
+
+    engine = SpeechEngine(
+        native_audio_dir=str(tmp_path / "native"),
+        cache_dir=str(tmp_path / "cache"),
+        murf_api_key="test-key",
+    )
+    assert engine.native_audio_index == frozenset({"lesson1/phrase_001.mp3"})
+
+    (lesson_dir / "phrase_002.mp3").write_bytes(b"new")
+    assert engine._check_pre_recorded("lesson1", "phrase_002", None, 1.0) is None
+
+    engine._native_audio_indexed_at -= NATIVE_AUDIO_INDEX_TTL
+    assert engine._check_pre_recorded("lesson1", "phrase_002", None, 1.0) == (
+        lesson_dir / "phrase_002.mp3"
+    )
+
+
+def test_native_audio_index_follows_symlinked_directories(tmp_path):
+    shared = tmp_path / "shared" / "lesson1"
+    shared.mkdir(parents=True)
+    (shared / "phrase_001.mp3").write_bytes(b"normal")
+    # A link back up the tree must not loop forever
+    (shared / "loop").symlink_to(tmp_path / "native", target_is_directory=True)
+    native = tmp_path / "native"
+    native.mkdir()
+    (native / "lesson1").symlink_to(shared, target_is_directory=True)
+
+    engine = SpeechEngine(
+        native_audio_dir=str(native),
+        cache_dir=str(tmp_path / "cache"),
+        murf_api_key="test-key",
+    )
+
+    assert engine.native_audio_index == frozenset({"lesson1/phrase_001.mp3"})
+    assert engine._check_pre_recorded("lesson1", "phrase_001", None, 1.0) == (
+        native / "lesson1" / "phrase_001.mp3"
+    )
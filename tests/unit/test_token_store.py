@@ -0,0 +1,37 @@
+"""Unit tests for refresh token stores."""
+
+import pytest
+
+from src.services import token_store
+from src.services.token_store import InMemoryTokenStore, create_token_store
+
+
+def test_in_memory_store_set_get_revoke():
+    store = InMemoryTokenStore()
+    assert store.get(1) is None
+
+    store.set(1, "token-a", ttl_seconds=60)
+    store.set(1, "token-b", ttl_seconds=60)
+    assert store.get(1) == "token-b"
+
+    store.revoke(1)
+    store.revoke(1)
+    assert store.get(1) is None
+
+
+def test_in_memory_store_expires_tokens(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(token_store.time, "monotonic", lambda: now[0])
+    store = InMemoryTokenStore()
+
+    store.set(7, "token", ttl_seconds=10)
+    now[0] += 9
+    assert store.get(7) == "token"
+    now[0] += 1
+    assert store.get(7) is None
+
+
+def test_create_token_store_rejects_unknown_backend():
+    assert isinstance(create_token_store("memory"), InMemoryTokenStore)
+    with pytest.raises(ValueError):
+        create_token_store("memcached")
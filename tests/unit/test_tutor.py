@@ -1,3 +1,4 @@
+from datetime import timezone
 from typing import Dict, Optional, Any, Tuple
 from difflib import SequenceMatcher
 
@@ -162,6 +163,34 @@ def test_determine_next_dialogue_uses_fuzzy_match_when_close():
     assert next_id == "turn_fuzzy"
 
 
+def test_determine_next_dialogue_skips_distance_for_length_mismatch(monkeypatch):
+    import src.core.tutor as tutor_module
+
+    compared = []
+
+    def fake_distance(a, b, score_cutoff=None):
+        compared.append(b)
+        return 0
+
+    monkeypatch.setattr(tutor_module.Levenshtein, "distance", fake_distance)
+    dialogue = {
+        "id": "turn_1",
+        "options": [
+            {"match": "Dzień dobry, jak się masz?", "next": "turn_long"},
+            {"match": "Świentie", "next": "turn_fuzzy"},
+        ],
+    }
+    lesson_data = {"dialogues": [dialogue]}
+
+    tutor = _build_tutor({"lesson_a": lesson_data})
+    next_id = tutor._determine_next_dialogue(
+        "swietnie", dialogue, lesson_data, score=0.8
+    )
+
+    assert next_id == "turn_fuzzy"
+    assert compared == ["świentie"]
+
+
 def test_determine_next_dialogue_falls_back_to_default():
     dialogue = {
         "id": "turn_1",
@@ -180,6 +209,35 @@ def test_determine_next_dialogue_falls_back_to_default():
     assert next_id == "turn_default"
 
 
+def test_determine_next_dialogue_normalizes_each_match_once():
+    class CountingFeedbackEngine(StubFeedbackEngine):
+        def __init__(self):
+            super().__init__()
+            self.normalized = []
+
+        def normalize_text(self, text: str) -> str:
+            self.normalized.append(text)
+            return super().normalize_text(text)
+
+    dialogue = {
+        "id": "turn_1",
+        "options": [
+            {"match": "Tak", "next": "turn_yes"},
+            {"next": "turn_default", "default": True},
+        ],
+    }
+    lesson_data = {"dialogues": [dialogue]}
+    feedback_engine = CountingFeedbackEngine()
+    tutor = _build_tutor({"lesson_a": lesson_data}, feedback_engine=feedback_engine)
+
+    for _ in range(3):
+        tutor._determine_next_dialogue("nie", dialogue, lesson_data, score=0.2)
+
+    assert feedback_engine.normalized.count("Tak") == 1
+    assert feedback_engine.normalized.count("nie") == 3
+    assert dialogue["options"][0] == {"match": "Tak", "next": "turn_yes"}
+
+
 def test_determine_next_dialogue_without_options_advances_sequentially():
     dialogue = {
         "id": "turn_1",
@@ -196,6 +254,45 @@ def test_determine_next_dialogue_without_options_advances_sequentially():
     assert next_id == "turn_2"
 
 
+def test_determine_next_dialogue_rebuilds_sequence_for_reloaded_lesson():
+    tutor = _build_tutor({})
+    first = {"id": "L1", "dialogues": [{"id": "turn_1"}, {"id": "turn_2"}]}
+    assert tutor._determine_next_dialogue("x", {"id": "turn_1"}, first, 0.5) == (
+        "turn_2"
+    )
+    assert tutor._determine_next_dialogue("x", {"id": "turn_2"}, first, 0.5) is None
+
+    reloaded = {"id": "L1", "dialogues": [{"id": "turn_1"}, {"id": "turn_3"}]}
+    assert (
+        tutor._determine_next_dialogue("x", {"id": "turn_1"}, reloaded, 0.5) == "turn_3"
+    )
+
+
+def test_log_attempt_queues_rows_when_batching(monkeypatch):
+    import src.core.tutor as tutor_module
+
+    class BulkDatabase(StubDatabase):
+        def __init__(self):
+            super().__init__()
+            self.bulk_rows = []
+
+        def create_attempts_bulk(self, rows):
+            self.bulk_rows.extend(rows)
+            return len(rows)
+
+    monkeypatch.setattr(tutor_module, "BATCH_ATTEMPT_WRITES", True)
+    database = BulkDatabase()
+    tutor = _build_tutor({}, database=database)
+    try:
+        assert tutor._log_attempt(7, "turn_1", "Cześć", 0.9, "high") is None
+        tutor._attempt_writer.flush()
+    finally:
+        tutor._attempt_writer.stop()
+
+    assert database.records == []
+    assert [row["phrase_id"] for row in database.bulk_rows] == ["turn_1"]
+
+
 @pytest.mark.parametrize(
     "score,feedback_type,expected",
     [
@@ -323,12 +420,44 @@ def test_respond_logs_attempt_and_updates_srs(monkeypatch):
     assert response["status"] == "success"
     assert response["data"]["next_dialogue_id"] == "turn_2"
     assert response["metadata"]["attempt_id"] == 42
+    created_at = database.records[0][1]["created_at"]
+    assert response["metadata"]["timestamp"] == created_at.isoformat() + "Z"
+    assert response["metadata"]["timestamp_ms"] == int(
+        created_at.replace(tzinfo=timezone.utc).timestamp() * 1000
+    )
     assert "/static/audio/turn_1.mp3" in response["data"]["audio"]
-    assert tutor._consecutive_lows[(7, "turn_1")] == 1
+    assert tutor._consecutive_lows["turn_1"][7] == 1
     assert srs_manager.calls[0]["quality"] == 0
     assert srs_manager.calls[0]["confidence"] == 3
 
 
+def test_respond_clears_low_streak_after_better_answer():
+    dialogue = {"id": "turn_1", "expected": ["Tak"], "options": []}
+    lessons = {"lesson_a": {"dialogues": [dialogue]}}
+    feedback = StubFeedbackEngine(
+        feedback_response={"feedback_type": "low", "score": 0.1, "reply_text": "?"}
+    )
+    tutor = _build_tutor(lessons, feedback_engine=feedback)
+
+    for user_id in (1, 1, 2):
+        tutor.respond(
+            user_id=user_id, text="nie", lesson_id="lesson_a", dialogue_id="turn_1"
+        )
+    assert tutor._consecutive_lows == {"turn_1": {1: 2, 2: 1}}
+    assert feedback.last_generate_feedback_args["consecutive_lows"] == 0
+
+    feedback.feedback_response = {
+        "feedback_type": "high",
+        "score": 1.0,
+        "reply_text": "!",
+    }
+    for user_id in (1, 2):
+        tutor.respond(
+            user_id=user_id, text="tak", lesson_id="lesson_a", dialogue_id="turn_1"
+        )
+    assert tutor._consecutive_lows == {}
+
+
 def test_execute_ai_detected_command_change_topic_needs_info(monkeypatch):
     lessons = {
         "A1_L01": {
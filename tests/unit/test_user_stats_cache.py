@@ -0,0 +1,23 @@
+"""Unit tests for the per-user stats cache."""
+
+from src.services.user_stats_cache import UserStatsCache
+
+
+def test_user_stats_cache_skips_payload_built_before_invalidation():
+    cache = UserStatsCache()
+    generation = cache.generation(5)
+    cache.invalidate(5)  # an attempt lands while the payload is built
+    cache.store(5, generation, {"stale": True})
+    assert cache.get(5) is None
+
+    generation = cache.generation(5)
+    cache.store(5, generation, {"fresh": True})
+    assert cache.get(5) == {"fresh": True}
+
+
+def test_user_stats_cache_global_invalidation_rejects_pending_builds():
+    cache = UserStatsCache()
+    generation = cache.generation(5)
+    cache.invalidate()
+    cache.store(5, generation, {"stale": True})
+    assert cache.get(5) is None